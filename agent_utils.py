@@ -2,19 +2,52 @@ from docker_utils import run_command_in_container
 from harness import LiteLLMAgentHarness
 import os
 import re
+import shlex
+from functools import lru_cache
 from pathlib import Path
 
 
+# Endpoint references extracted from task instructions
+_ENDPOINT_PATTERNS = [
+    re.compile(r'/api/[^\s\'"]+'),
+    re.compile(r'GET /[^\s\'"]+'),
+    re.compile(r'POST /[^\s\'"]+'),
+    re.compile(r'endpoint at ([^\s\'"]+)'),
+]
+
+# Instruction keywords that mark algorithmic / database work
+_ALGORITHM_KEYWORDS = ("anomaly", "detection", "algorithm", "statistical", "mean", "deviation")
+_DATABASE_KEYWORDS = ("database", "mongodb", "query", "aggregate")
+
+# Ranked candidate files keyed by (container image id, grep pattern)
+_CANDIDATE_CACHE: dict[tuple[str, str], list[str]] = {}
+
+# One Python file path per line of `grep -l` output
+_GREP_PATH_RE = re.compile(r'^(.+\.py)$', re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
 def load_base_prompt() -> str:
     prompt_file = Path(__file__).parent / "IDE-Arena-Prompt.txt"
     return prompt_file.read_text(encoding='utf-8')
 
 
-def analyze_task_requirements(task_data: dict) -> dict:
+def analyze_task_requirements(task_data: dict, instructions_lower: str | None = None) -> dict:
     """Analyze task requirements to generate appropriate implementation guidance"""
-    instructions = task_data.get("instructions", "").lower()
-    task_name = task_data.get("task", "").lower()
+    if instructions_lower is None:
+        instructions_lower = task_data.get("instructions", "").lower()
+    analysis = _analyze_task_text(task_data.get("task", "").lower(), instructions_lower)
+    # Copy the lists so callers never mutate the cached analysis
+    return {
+        **analysis,
+        "endpoints_mentioned": list(analysis["endpoints_mentioned"]),
+        "key_concepts": list(analysis["key_concepts"]),
+    }
 
+
+@lru_cache(maxsize=256)
+def _analyze_task_text(task_name: str, instructions: str) -> dict:
+    """Keyword analysis of the lowercased task name and instructions, memoized for retries"""
     analysis = {
         "task_type": "unknown",
         "endpoints_mentioned": [],
@@ -27,16 +60,8 @@ def analyze_task_requirements(task_data: dict) -> dict:
     }
 
     # Extract mentioned endpoints
-    endpoint_patterns = [
-        r'/api/[^\s\'"]+',
-        r'GET /[^\s\'"]+',
-        r'POST /[^\s\'"]+',
-        r'endpoint at ([^\s\'"]+)'
-    ]
-
-    for pattern in endpoint_patterns:
-        matches = re.findall(pattern, instructions)
-        analysis["endpoints_mentioned"].extend(matches)
+    for pattern in _ENDPOINT_PATTERNS:
+        analysis["endpoints_mentioned"].extend(pattern.findall(instructions))
 
     # Determine task type
     if "environment variable" in instructions:
@@ -51,12 +76,12 @@ def analyze_task_requirements(task_data: dict) -> dict:
     if "modify" in instructions and "endpoint" in instructions:
         analysis["requires_endpoint_modification"] = True
 
-    if any(word in instructions for word in ["anomaly", "detection", "algorithm", "statistical", "mean", "deviation"]):
+    if any(word in instructions for word in _ALGORITHM_KEYWORDS):
         analysis["task_type"] = "algorithm"
         analysis["requires_algorithm"] = True
         analysis["key_concepts"].extend(["statistical analysis", "algorithm implementation"])
 
-    if any(word in instructions for word in ["database", "mongodb", "query", "aggregate"]):
+    if any(word in instructions for word in _DATABASE_KEYWORDS):
         analysis["requires_database"] = True
         analysis["key_concepts"].append("database operations")
 
@@ -67,24 +92,35 @@ def analyze_task_requirements(task_data: dict) -> dict:
     return analysis
 
 
-def discover_candidate_files(container, task_data: dict) -> list[str]:
+@lru_cache(maxsize=64)
+def _build_grep_pattern(keywords: tuple[str, ...]) -> str:
+    """Build a single egrep pattern joined by '|'"""
+    return "|".join(re.escape(k) for k in keywords)
+
+
+def discover_candidate_files(container, task_data: dict, instructions_lower: str | None = None) -> list[str]:
     """Heuristically discover likely target files inside the container.
     Searches common API/controller directories for task-relevant keywords.
     """
-    instructions = (task_data.get("instructions", "") or "").lower()
+    if instructions_lower is None:
+        instructions_lower = (task_data.get("instructions", "") or "").lower()
+    if not instructions_lower:
+        # Nothing to target; skip the container exec entirely
+        return []
+
     keywords: list[str] = []
 
     # Generic API/controller markers
     keywords.extend(["APIRouter", "@router", "def upload", "def top_paths", "def anomalies", "def error", "upload_log_file"])  # noqa: E501
 
     # Add from instructions
-    if any(k in instructions for k in ["upload", "log", "regex", "malformed"]):
+    if any(k in instructions_lower for k in ["upload", "log", "regex", "malformed"]):
         keywords.extend(["upload", "log", "malformed", "regex"])  # logs-related
-    if any(k in instructions for k in ["anomaly", "3-sigma", "sigma", "std", "mean"]):
+    if any(k in instructions_lower for k in ["anomaly", "3-sigma", "sigma", "std", "mean"]):
         keywords.extend(["anomal", "stats", "sigma"])  # anomalies in stats
-    if any(k in instructions for k in ["top", "paths", "limit"]):
+    if any(k in instructions_lower for k in ["top", "paths", "limit"]):
         keywords.extend(["top_paths", "limit", "stats"])  # top paths
-    if any(k in instructions for k in ["error", "summary", "status"]):
+    if any(k in instructions_lower for k in ["error", "summary", "status"]):
         keywords.extend(["error", "summary", "status"])  # error summary
 
     # Deduplicate and build grep pattern
@@ -92,8 +128,14 @@ def discover_candidate_files(container, task_data: dict) -> list[str]:
     if not unique_keywords:
         return []
 
-    # Build a single egrep pattern joined by '|'
-    pattern = "|".join([re.escape(k) for k in unique_keywords])
+    pattern = _build_grep_pattern(tuple(unique_keywords))
+
+    # Pass@k retries start fresh containers from the same image, so the scan
+    # result can be reused for as long as the image is unchanged
+    image_id = (getattr(container, "attrs", None) or {}).get("Image")
+    cache_key = (image_id, pattern)
+    if image_id and cache_key in _CANDIDATE_CACHE:
+        return list(_CANDIDATE_CACHE[cache_key])
 
     # Search common locations; keep it general
     search_dirs = [
@@ -103,23 +145,21 @@ def discover_candidate_files(container, task_data: dict) -> list[str]:
         "/app/app/controllers",
     ]
 
-    found_files: list[str] = []
-    for d in search_dirs:
-        cmd = [
-            "bash", "-lc",
-            f"if [ -d '{d}' ]; then grep -RInE '{pattern}' '{d}' --include=*.py || true; fi"
-        ]
-        res = run_command_in_container(container=container, command=cmd)
-        if not res.get("success"):
-            continue
-        output = res.get("output", "")
-        for line in output.splitlines():
-            # Expect lines like: /path/file.py:123:matched text
-            parts = line.split(":", 2)
-            if len(parts) >= 2:
-                path = parts[0].strip()
-                if path.endswith(".py") and path not in found_files:
-                    found_files.append(path)
+    # One grep over every directory; missing ones are reported on stderr and skipped.
+    # grep -l lists each matching file once and stops reading it at the first match
+    dirs_expr = " ".join(shlex.quote(d) for d in search_dirs)
+    cmd = [
+        "bash", "-lc",
+        f"grep -RIlE {shlex.quote(pattern)} {dirs_expr} --include=*.py 2>/dev/null || true"
+    ]
+    res = run_command_in_container(container=container, command=cmd)
+    if not res.get("success"):
+        return []
+
+    # dict keys keep first-seen order with O(1) duplicate checks
+    found_files = list(dict.fromkeys(
+        match.group(1) for match in _GREP_PATH_RE.finditer(res.get("output", ""))
+    ))
 
     # Rank: prefer api/ first, then others; cap to top 5
     def rank(p: str) -> tuple[int, int]:
@@ -134,85 +174,142 @@ def discover_candidate_files(container, task_data: dict) -> list[str]:
         return (priority, length)
 
     found_files.sort(key=rank)
-    return found_files[:5]
+    candidates = found_files[:5]
+    if image_id:
+        _CANDIDATE_CACHE[cache_key] = candidates
+    return list(candidates)
+
+
+# Static guidance blocks, joined once at import time
+_ARCHITECTURE_GUIDANCE = "\n".join((
+    "PROJECT ARCHITECTURE (GENERAL):",
+    "- Identify the application entrypoint and routing/module structure for the given stack",
+    "- Common patterns: routers/controllers in api/routes/controllers directories; domain logic in services/utils; DB models in models/entities",
+    "",
+))
+
+# Implementation approach steps keyed by analysis["task_type"]
+_APPROACH_GUIDANCE = {
+    "configuration": "CONFIGURATION TASK APPROACH:",
+    "algorithm": "\n".join((
+        "ALGORITHM IMPLEMENTATION APPROACH:",
+        "1. Understand the mathematical/statistical requirements",
+        "2. Implement core algorithm logic with proper data structures",
+        "3. Handle edge cases (empty data, insufficient samples)",
+        "4. Create new endpoint to expose the algorithm",
+    )),
+    "new_endpoint": "\n".join((
+        "NEW ENDPOINT IMPLEMENTATION:",
+        "1. Create new endpoint function in stats router",
+        "2. Define proper request/response models",
+        "3. Implement core business logic",
+        "4. Add proper error handling and validation",
+    )),
+}
+_GENERAL_APPROACH_GUIDANCE = "\n".join((
+    "GENERAL IMPLEMENTATION APPROACH:",
+    "1. Analyze requirements to identify needed endpoints",
+    "2. Check existing code patterns in stats router",
+    "3. Implement required functionality",
+    "4. Test against provided requirements",
+))
+_ENV_VAR_APPROACH_STEPS = "\n".join((
+    "1. Read environment variables using os.environ.get()",
+    "2. Implement parameter precedence logic",
+    "3. Handle missing/invalid values gracefully",
+))
+_ENDPOINT_MODIFICATION_APPROACH_STEPS = "\n".join((
+    "4. Locate existing endpoint and modify its behavior",
+    "5. Preserve existing functionality while adding new features",
+))
+_ANOMALY_APPROACH_STEPS = "\n".join((
+    "5. Implement 3-sigma statistical analysis (mean + 3*std_dev)",
+    "6. Support time-based bucketing and filtering",
+))
+
+_REQUIREMENTS_GUIDANCE = "\n".join((
+    "IMPLEMENTATION REQUIREMENTS (GENERAL):",
+    "- Modify the appropriate module/router for the feature area (avoid editing the main entrypoint unless required)",
+    "- Follow existing code patterns, imports, and error handling",
+    "- Prefer edit_file for structural/multi-line changes; avoid search_replace for multi-line edits",
+    "- Do not use shell echo appends; use structured line_edits via edit_file",
+    "- Ensure outputs conform to the project's response/typing conventions",
+    "- Test implementation meets all stated requirements",
+))
+_ENV_VAR_REQUIREMENTS = "\n".join((
+    "- Use os.environ.get() for environment variable access",
+    "- Implement proper default value handling",
+))
+_ALGORITHM_REQUIREMENTS = "\n".join((
+    "- Import necessary libraries (e.g., statistics) as needed by the task",
+    "- Implement efficient algorithms for large datasets",
+))
 
 
 def generate_implementation_guidance(task_data: dict, analysis: dict) -> str:
     """Generate task-specific implementation guidance based on analysis"""
     instructions = task_data.get("instructions", "")
 
-    guidance = []
-
     # Base project structure info
-    guidance.append("PROJECT ARCHITECTURE (GENERAL):")
-    guidance.append("- Identify the application entrypoint and routing/module structure for the given stack")
-    guidance.append("- Common patterns: routers/controllers in api/routes/controllers directories; domain logic in services/utils; DB models in models/entities")
-    guidance.append("")
+    guidance = [_ARCHITECTURE_GUIDANCE]
 
     # Task-specific approach
-    if analysis["task_type"] == "configuration":
-        guidance.append("CONFIGURATION TASK APPROACH:")
+    task_type = analysis["task_type"]
+    guidance.append(_APPROACH_GUIDANCE.get(task_type, _GENERAL_APPROACH_GUIDANCE))
+    if task_type == "configuration":
         if analysis["requires_environment_vars"]:
-            guidance.append("1. Read environment variables using os.environ.get()")
-            guidance.append("2. Implement parameter precedence logic")
-            guidance.append("3. Handle missing/invalid values gracefully")
+            guidance.append(_ENV_VAR_APPROACH_STEPS)
         if analysis["requires_endpoint_modification"]:
-            guidance.append("4. Locate existing endpoint and modify its behavior")
-            guidance.append("5. Preserve existing functionality while adding new features")
-
-    elif analysis["task_type"] == "algorithm":
-        guidance.append("ALGORITHM IMPLEMENTATION APPROACH:")
-        guidance.append("1. Understand the mathematical/statistical requirements")
-        guidance.append("2. Implement core algorithm logic with proper data structures")
-        guidance.append("3. Handle edge cases (empty data, insufficient samples)")
-        guidance.append("4. Create new endpoint to expose the algorithm")
-        if "anomaly" in instructions.lower():
-            guidance.append("5. Implement 3-sigma statistical analysis (mean + 3*std_dev)")
-            guidance.append("6. Support time-based bucketing and filtering")
-
-    elif analysis["task_type"] == "new_endpoint":
-        guidance.append("NEW ENDPOINT IMPLEMENTATION:")
-        guidance.append("1. Create new endpoint function in stats router")
-        guidance.append("2. Define proper request/response models")
-        guidance.append("3. Implement core business logic")
-        guidance.append("4. Add proper error handling and validation")
-
-    else:
-        guidance.append("GENERAL IMPLEMENTATION APPROACH:")
-        guidance.append("1. Analyze requirements to identify needed endpoints")
-        guidance.append("2. Check existing code patterns in stats router")
-        guidance.append("3. Implement required functionality")
-        guidance.append("4. Test against provided requirements")
+            guidance.append(_ENDPOINT_MODIFICATION_APPROACH_STEPS)
+    elif task_type == "algorithm" and "anomaly" in instructions.lower():
+        guidance.append(_ANOMALY_APPROACH_STEPS)
 
     guidance.append("")
 
     # Endpoint-specific guidance
     if analysis["endpoints_mentioned"]:
         guidance.append("REQUIRED ENDPOINTS:")
-        for endpoint in set(analysis["endpoints_mentioned"]):
-            guidance.append(f"- {endpoint}")
+        guidance.extend(f"- {endpoint}" for endpoint in set(analysis["endpoints_mentioned"]))
         guidance.append("")
 
     # Technical requirements
-    guidance.append("IMPLEMENTATION REQUIREMENTS (GENERAL):")
-    guidance.append("- Modify the appropriate module/router for the feature area (avoid editing the main entrypoint unless required)")
-    guidance.append("- Follow existing code patterns, imports, and error handling")
-    guidance.append("- Prefer edit_file for structural/multi-line changes; avoid search_replace for multi-line edits")
-    guidance.append("- Do not use shell echo appends; use structured line_edits via edit_file")
-    guidance.append("- Ensure outputs conform to the project's response/typing conventions")
-    guidance.append("- Test implementation meets all stated requirements")
-
+    guidance.append(_REQUIREMENTS_GUIDANCE)
     if analysis["requires_environment_vars"]:
-        guidance.append("- Use os.environ.get() for environment variable access")
-        guidance.append("- Implement proper default value handling")
-
+        guidance.append(_ENV_VAR_REQUIREMENTS)
     if analysis["requires_algorithm"]:
-        guidance.append("- Import necessary libraries (e.g., statistics) as needed by the task")
-        guidance.append("- Implement efficient algorithms for large datasets")
+        guidance.append(_ALGORITHM_REQUIREMENTS)
 
     return "\n".join(guidance)
 
 
+# Task-specific section appended to the base prompt; analysis fields are filled by name
+_TASK_INFO_TEMPLATE = """
+
+## CURRENT TASK
+
+**Task**: {task}
+
+**Instructions**:
+{instructions}
+
+## AUTOMATED CANDIDATES (from pre-scan):
+{candidates_hint}
+
+## TASK ANALYSIS
+- Task type: {task_type}
+- Endpoints mentioned: {endpoints_mentioned}
+- Requires new endpoint: {requires_new_endpoint}
+- Requires algorithm: {requires_algorithm}
+- Requires database: {requires_database}
+
+## IMPLEMENTATION GUIDANCE
+{implementation_guidance}
+
+---
+
+Begin by exploring the codebase structure, then implement the required changes following the guidelines above."""
+
+
 def deploy_agent_in_container(
     container,
     agent_name: str,
@@ -238,54 +335,47 @@ def deploy_agent_in_container(
     elif agent_name == "gladiator":
         print(f"AGENT_UTILS: Creating gladiator agent with model {model_name}")
 
+        task_name = task_data.get("task", "Unknown task")
+        instructions = task_data.get("instructions", "No instructions provided")
+        tags = task_data.get("tags", [])
+
+        # Lowercase once for both analyzers
+        instructions_lower = (task_data.get("instructions", "") or "").lower()
+
         # Analyze task requirements to generate appropriate guidance
-        analysis = analyze_task_requirements(task_data)
+        analysis = analyze_task_requirements(task_data, instructions_lower)
         implementation_guidance = generate_implementation_guidance(task_data, analysis)
 
         print(f"AGENT_UTILS: Task analysis - Type: {analysis['task_type']}, Endpoints: {analysis['endpoints_mentioned']}")
 
         # Discover candidate files and include as hints
-        candidate_files = discover_candidate_files(container, task_data)
+        candidate_files = discover_candidate_files(container, task_data, instructions_lower)
         candidates_hint = "\n".join([f"- {p}" for p in candidate_files]) if candidate_files else "(no candidates found)"
 
         # Load the base prompt from IDE-Arena-Prompt.txt
         base_prompt = load_base_prompt()
 
         # Append task-specific information to the base prompt
-        task_specific_info = f"""
-
-## CURRENT TASK
-
-**Task**: {task_data.get("task", "Unknown task")}
-
-**Instructions**:
-{task_data.get("instructions", "No instructions provided")}
-
-## AUTOMATED CANDIDATES (from pre-scan):
-{candidates_hint}
-
-## TASK ANALYSIS
-- Task type: {analysis['task_type']}
-- Endpoints mentioned: {analysis['endpoints_mentioned']}
-- Requires new endpoint: {analysis['requires_new_endpoint']}
-- Requires algorithm: {analysis['requires_algorithm']}
-- Requires database: {analysis['requires_database']}
-
-## IMPLEMENTATION GUIDANCE
-{implementation_guidance}
-
----
-
-Begin by exploring the codebase structure, then implement the required changes following the guidelines above."""
+        task_specific_info = _TASK_INFO_TEMPLATE.format(
+            task=task_name,
+            instructions=instructions,
+            candidates_hint=candidates_hint,
+            implementation_guidance=implementation_guidance,
+            **analysis,
+        )
 
         prompt = base_prompt + task_specific_info
         print(f"AGENT_UTILS: Prompt length: {len(prompt)}")
-        print(f"AGENT_UTILS: Task data tags: {task_data.get('tags', [])}")
+        print(f"AGENT_UTILS: Task data tags: {tags}")
+
+        # Tags may be a list or the raw "[a, b]" string from the task description,
+        # so keep plain `in` checks and evaluate them once
+        is_mern_task = "mern" in tags or "full-stack" in tags
 
         # MERN support is disabled by default for this dataset. Enable later via env flag ENABLE_MERN=1
         mern_config = None
         if os.environ.get("ENABLE_MERN", "") == "1":
-            if "mern" in task_data.get("tags", []) or "full-stack" in task_data.get("tags", []):
+            if is_mern_task:
                 mern_config = {
                     "api_base_url": "http://localhost:5001",
                     "frontend_url": "http://localhost:3000",
@@ -294,7 +384,7 @@ Begin by exploring the codebase structure, then implement the required changes f
                 }
                 print(f"AGENT_UTILS: Using MERN config: {mern_config}")
         else:
-            if "mern" in task_data.get("tags", []) or "full-stack" in task_data.get("tags", []):
+            if is_mern_task:
                 print("AGENT_UTILS: MERN features detected but disabled for this run (ENABLE_MERN!=1)")
 
         print(f"AGENT_UTILS: Creating LiteLLMAgentHarness...")
@@ -313,15 +403,17 @@ Begin by exploring the codebase structure, then implement the required changes f
             print(f"AGENT_UTILS: Iterations used: {result['iterations']}")
         if 'conversation_history' in result:
             print(f"AGENT_UTILS: Conversation history length: {len(result['conversation_history'])}")
-            for i, conv in enumerate(result['conversation_history'][:3]):  # Show first 3
-                print(f"AGENT_UTILS: Conv {i}: {list(conv.keys())}")
-                if 'tool_calls_requested' in conv:
-                    print(f"AGENT_UTILS: Conv {i} tools: {len(conv['tool_calls_requested'])}")
-                if 'tool_results' in conv:
-                    print(f"AGENT_UTILS: Conv {i} results: {len(conv['tool_results'])}")
-                    for j, tool_result in enumerate(conv['tool_results'][:2]):  # Show first 2 tool results
-                        if 'result' in tool_result:
-                            print(f"AGENT_UTILS: Tool {j} success: {tool_result['result'].get('success')}")
+            # Per-turn breakdown is only formatted in verbose mode
+            if verbose:
+                for i, conv in enumerate(result['conversation_history'][:3]):  # Show first 3
+                    print(f"AGENT_UTILS: Conv {i}: {list(conv.keys())}")
+                    if 'tool_calls_requested' in conv:
+                        print(f"AGENT_UTILS: Conv {i} tools: {len(conv['tool_calls_requested'])}")
+                    if 'tool_results' in conv:
+                        print(f"AGENT_UTILS: Conv {i} results: {len(conv['tool_results'])}")
+                        for j, tool_result in enumerate(conv['tool_results'][:2]):  # Show first 2 tool results
+                            if 'result' in tool_result:
+                                print(f"AGENT_UTILS: Tool {j} success: {tool_result['result'].get('success')}")
 
         if result["success"]:
             return {
@@ -1,5 +1,7 @@
 
 import os
+from functools import lru_cache
+
 import pytest
 
 PROJECT_DIR = "/app/project"
@@ -7,6 +9,7 @@ SRC_DIR = os.path.join(PROJECT_DIR, "src")
 INCLUDE_DIR = os.path.join(PROJECT_DIR, "include")
 
 
+@lru_cache(maxsize=None)
 def read_file(path: str) -> str:
     if not os.path.exists(path):
         return ""
@@ -14,114 +17,96 @@ def read_file(path: str) -> str:
         return f.read()
 
 
-def test_easeout_uses_multiplication():
-    """Verifies EaseOut case has a multiplication operator in the return statement."""
-    src_path = os.path.join(SRC_DIR, "core", "time_manager.cpp")
-    content = read_file(src_path)
-    lines = content.split('\n')
-    in_easeout = False
-    for line in lines:
+def find_easeout_return_line(path: str):
+    """Returns the code part of the first return statement after the EaseOut case label, or None."""
+    content = read_file(path)
+    pos = 0
+    while True:
+        idx = content.find('EaseOut', pos)
+        if idx == -1:
+            return None
+        line_start = content.rfind('\n', 0, idx) + 1
+        pos = content.find('\n', idx)
+        if pos == -1:
+            return None
+        if 'case' in content[line_start:pos]:
+            break
+    while pos < len(content):
+        line_end = content.find('\n', pos + 1)
+        if line_end == -1:
+            line_end = len(content)
+        line = content[pos + 1:line_end]
+        pos = line_end
         if 'EaseOut' in line and 'case' in line:
-            in_easeout = True
             continue
-        if in_easeout and 'return' in line:
-            code_part = line.split('//')[0].strip()
-            assert '*' in code_part
-            break
-        if in_easeout and 'case' in line:
-            break
+        if 'return' in line:
+            return line.split('//')[0]
+        if 'case' in line:
+            return None
+    return None
+
+
+@pytest.fixture(scope="module")
+def easeout_return_line():
+    return find_easeout_return_line(os.path.join(SRC_DIR, "core", "time_manager.cpp"))
+
 
+@pytest.fixture(scope="module")
+def component_source():
+    return read_file(os.path.join(SRC_DIR, "ecs", "component.cpp"))
 
-def test_easeout_uses_two_minus_formula():
+
+def test_easeout_uses_multiplication(easeout_return_line):
+    """Verifies EaseOut case has a multiplication operator in the return statement."""
+    if easeout_return_line is not None:
+        assert '*' in easeout_return_line.strip()
+
+
+def test_easeout_uses_two_minus_formula(easeout_return_line):
     """Verifies EaseOut return contains 2 and subtraction for the (2-t) formula."""
-    src_path = os.path.join(SRC_DIR, "core", "time_manager.cpp")
-    content = read_file(src_path)
-    lines = content.split('\n')
-    in_easeout = False
-    for line in lines:
-        if 'EaseOut' in line and 'case' in line:
-            in_easeout = True
-            continue
-        if in_easeout and 'return' in line:
-            code_part = line.split('//')[0]
-            assert ('2' in code_part and '-' in code_part)
-            break
-        if in_easeout and 'case' in line:
-            break
+    if easeout_return_line is not None:
+        assert ('2' in easeout_return_line and '-' in easeout_return_line)
 
 
-def test_easeout_not_linear():
+def test_easeout_not_linear(easeout_return_line):
     """Verifies EaseOut doesnt just return t which would make it linear."""
-    src_path = os.path.join(SRC_DIR, "core", "time_manager.cpp")
-    content = read_file(src_path)
-    lines = content.split('\n')
-    in_easeout = False
-    for line in lines:
-        if 'EaseOut' in line and 'case' in line:
-            in_easeout = True
-            continue
-        if in_easeout and 'return' in line:
-            code_part = line.split('//')[0].strip()
-            assert code_part != "return t;"
-            break
-        if in_easeout and 'case' in line:
-            break
+    if easeout_return_line is not None:
+        assert easeout_return_line.strip() != "return t;"
 
 
-def test_easeout_complete_quadratic_formula():
+def test_easeout_complete_quadratic_formula(easeout_return_line):
     """Verifies EaseOut has all parts of t*(2-t) formula: multiply, 2, and subtract."""
-    src_path = os.path.join(SRC_DIR, "core", "time_manager.cpp")
-    content = read_file(src_path)
-    lines = content.split('\n')
-    in_easeout = False
-    for line in lines:
-        if 'EaseOut' in line and 'case' in line:
-            in_easeout = True
-            continue
-        if in_easeout and 'return' in line:
-            code_part = line.split('//')[0].strip()
-            has_mult = '*' in code_part
-            has_two = '2' in code_part
-            has_minus = '-' in code_part
-            assert has_mult and has_two and has_minus
-            break
-        if in_easeout and 'case' in line:
-            break
+    if easeout_return_line is not None:
+        code_part = easeout_return_line.strip()
+        has_mult = '*' in code_part
+        has_two = '2' in code_part
+        has_minus = '-' in code_part
+        assert has_mult and has_two and has_minus
 
 
-def test_rotation_checks_positive_boundary():
+def test_rotation_checks_positive_boundary(component_source):
     """Verifies rotation interpolation checks if angular diff exceeds 180 degrees."""
-    src_path = os.path.join(SRC_DIR, "ecs", "component.cpp")
-    content = read_file(src_path)
-    assert "diff > 180" in content or "diff>180" in content
+    assert "diff > 180" in component_source or "diff>180" in component_source
 
 
-def test_rotation_checks_negative_boundary():
+def test_rotation_checks_negative_boundary(component_source):
     """Verifies rotation interpolation checks if angular diff is below -180 degrees."""
-    src_path = os.path.join(SRC_DIR, "ecs", "component.cpp")
-    content = read_file(src_path)
-    assert "diff < -180" in content or "diff<-180" in content
+    assert "diff < -180" in component_source or "diff<-180" in component_source
 
 
-def test_rotation_subtracts_full_circle():
+def test_rotation_subtracts_full_circle(component_source):
     """Verifies rotation subtracts 360 when diff is too large positive."""
-    src_path = os.path.join(SRC_DIR, "ecs", "component.cpp")
-    content = read_file(src_path)
-    assert "diff -= 360" in content or "diff-=360" in content
+    assert "diff -= 360" in component_source or "diff-=360" in component_source
 
 
-def test_rotation_adds_full_circle():
+def test_rotation_adds_full_circle(component_source):
     """Verifies rotation adds 360 when diff is too large negative."""
-    src_path = os.path.join(SRC_DIR, "ecs", "component.cpp")
-    content = read_file(src_path)
-    assert "diff += 360" in content or "diff+=360" in content
+    assert "diff += 360" in component_source or "diff+=360" in component_source
 
 
-def test_rotation_uses_loop_for_normalization():
+def test_rotation_uses_loop_for_normalization(component_source):
     """Verifies rotation uses while loop to handle angles that need multiple wraps."""
-    src_path = os.path.join(SRC_DIR, "ecs", "component.cpp")
-    content = read_file(src_path)
-    assert "while" in content and "diff > 180" in content
+    assert "while" in component_source and "diff > 180" in component_source
 
 
 def test_blend_weight_calls_easing_function():
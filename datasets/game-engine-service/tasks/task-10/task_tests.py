@@ -3,327 +3,291 @@ Fixed Timestep Task Tests
 """
 
 import re
+from functools import lru_cache
+from pathlib import Path
+
 import pytest
 
 
+@lru_cache(maxsize=None)
 def read_file_content(filepath: str) -> str:
-    """Read and return the contents of a source file."""
-    with open(filepath, 'r') as f:
-        return f.read()
+    """Read and return the contents of a source file, once per test session."""
+    return Path(filepath).read_bytes().decode()
 
 
-class TestTimeManagerFixedTimestepDeclarations:
-    """Tests for fixed timestep declarations in TimeManager header."""
+_BRACE_RE = re.compile(r'[{}]')
 
-    def test_fixed_delta_time_member_declared(self):
-        """
-        Validates that TimeManager declares a fixedDeltaTime_ member
-        as a double to store the fixed physics timestep.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_member = re.search(r'double\s+fixedDeltaTime_\s*;', content)
-        assert has_member is not None, \
-            "TimeManager must have fixedDeltaTime_ as double member"
 
-    def test_fixed_time_accumulator_member_declared(self):
-        """
-        Confirms that TimeManager declares a fixedTimeAccumulator_ member
-        as a double to track accumulated time for fixed updates.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_member = re.search(r'double\s+fixedTimeAccumulator_\s*;', content)
-        assert has_member is not None, \
-            "TimeManager must have fixedTimeAccumulator_ as double member"
+def find_closing_brace(source: str, start: int) -> int:
+    """
+    Return the index of the '}' that closes a block whose body starts at
+    start, or len(source) if the block is never closed.
+    """
+    depth = 1
+    for brace in _BRACE_RE.finditer(source, start):
+        depth += 1 if brace.group() == '{' else -1
+        if depth == 0:
+            return brace.start()
+    return len(source)
 
-    def test_set_fixed_delta_time_declared(self):
-        """
-        Verifies that TimeManager declares a setFixedDeltaTime method
-        taking a double parameter.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_method = re.search(r'void\s+setFixedDeltaTime\s*\(\s*double', content)
-        assert has_method is not None, \
-            "TimeManager must declare setFixedDeltaTime(double) method"
 
-    def test_get_fixed_delta_time_declared(self):
-        """
-        Confirms that TimeManager declares a getFixedDeltaTime method
-        returning a double.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_method = re.search(r'double\s+getFixedDeltaTime\s*\(\s*\)', content)
-        assert has_method is not None, \
-            "TimeManager must declare getFixedDeltaTime() method"
+def extract_body(source: str, signature: re.Pattern):
+    """
+    Return the block opened by the first match of signature (which must end
+    at the opening '{'), or None if signature does not match.
+    """
+    match = signature.search(source)
+    if match is None:
+        return None
+    return source[match.end():find_closing_brace(source, match.end())]
 
-    def test_consume_fixed_time_step_declared(self):
-        """
-        Validates that TimeManager declares a consumeFixedTimeStep method
-        returning a bool.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_method = re.search(r'bool\s+consumeFixedTimeStep\s*\(\s*\)', content)
-        assert has_method is not None, \
-            "TimeManager must declare consumeFixedTimeStep() method"
 
-    def test_get_fixed_update_alpha_declared(self):
-        """
-        Confirms that TimeManager declares a getFixedUpdateAlpha method
-        returning a double for interpolation.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_method = re.search(r'double\s+getFixedUpdateAlpha\s*\(\s*\)', content)
-        assert has_method is not None, \
-            "TimeManager must declare getFixedUpdateAlpha() method"
+@pytest.fixture(scope="session")
+def time_manager_header() -> str:
+    return read_file_content('project/include/core/time_manager.h')
+
+
+@pytest.fixture(scope="session")
+def time_manager_source() -> str:
+    return read_file_content('project/src/core/time_manager.cpp')
+
+
+@pytest.fixture(scope="session")
+def component_header() -> str:
+    return read_file_content('project/include/ecs/component.h')
+
+
+@pytest.fixture(scope="session")
+def component_source() -> str:
+    return read_file_content('project/src/ecs/component.cpp')
+
+
+_FIXED_DELTA_TIME_MEMBER_RE = re.compile(r'double\s+fixedDeltaTime_\s*;')
+_FIXED_TIME_ACCUMULATOR_MEMBER_RE = re.compile(r'double\s+fixedTimeAccumulator_\s*;')
+_SET_FIXED_DELTA_TIME_DECL_RE = re.compile(r'void\s+setFixedDeltaTime\s*\(\s*double')
+_GET_FIXED_DELTA_TIME_DECL_RE = re.compile(r'double\s+getFixedDeltaTime\s*\(\s*\)')
+_CONSUME_FIXED_TIME_STEP_DECL_RE = re.compile(r'bool\s+consumeFixedTimeStep\s*\(\s*\)')
+_GET_FIXED_UPDATE_ALPHA_DECL_RE = re.compile(r'double\s+getFixedUpdateAlpha\s*\(\s*\)')
+
+
+class TestTimeManagerFixedTimestepDeclarations:
+    """Tests for fixed timestep declarations in TimeManager header."""
+
+    @pytest.mark.parametrize("pattern,message", [
+        pytest.param(_FIXED_DELTA_TIME_MEMBER_RE,
+                     "TimeManager must have fixedDeltaTime_ as double member",
+                     id="fixedDeltaTime_"),
+        pytest.param(_FIXED_TIME_ACCUMULATOR_MEMBER_RE,
+                     "TimeManager must have fixedTimeAccumulator_ as double member",
+                     id="fixedTimeAccumulator_"),
+        pytest.param(_SET_FIXED_DELTA_TIME_DECL_RE,
+                     "TimeManager must declare setFixedDeltaTime(double) method",
+                     id="setFixedDeltaTime"),
+        pytest.param(_GET_FIXED_DELTA_TIME_DECL_RE,
+                     "TimeManager must declare getFixedDeltaTime() method",
+                     id="getFixedDeltaTime"),
+        pytest.param(_CONSUME_FIXED_TIME_STEP_DECL_RE,
+                     "TimeManager must declare consumeFixedTimeStep() method",
+                     id="consumeFixedTimeStep"),
+        pytest.param(_GET_FIXED_UPDATE_ALPHA_DECL_RE,
+                     "TimeManager must declare getFixedUpdateAlpha() method",
+                     id="getFixedUpdateAlpha"),
+    ])
+    def test_fixed_timestep_declared(self, time_manager_header, pattern, message):
+        """
+        Validates that TimeManager declares the fixedDeltaTime_ and
+        fixedTimeAccumulator_ members as doubles, along with the
+        setFixedDeltaTime, getFixedDeltaTime, consumeFixedTimeStep and
+        getFixedUpdateAlpha methods used for fixed-step updates.
+        """
+        assert pattern.search(time_manager_header) is not None, message
+
+
+_FIXED_DELTA_TIME_INIT_RE = re.compile(r'fixedDeltaTime_\s*\(')
+_FIXED_TIME_ACCUMULATOR_INIT_RE = re.compile(r'fixedTimeAccumulator_\s*\(\s*0\.0\s*\)')
+_UPDATE_BODY_RE = re.compile(r'void\s+TimeManager::update\s*\([^)]*\)[^{;]*\{')
+_RESET_BODY_RE = re.compile(r'void\s+TimeManager::reset\s*\([^)]*\)[^{;]*\{')
+_CONSUME_FIXED_TIME_STEP_BODY_RE = re.compile(
+    r'bool\s+TimeManager::consumeFixedTimeStep\s*\([^)]*\)[^{;]*\{'
+)
+_GET_FIXED_UPDATE_ALPHA_BODY_RE = re.compile(
+    r'double\s+TimeManager::getFixedUpdateAlpha\s*\([^)]*\)[^{;]*\{'
+)
 
 
 class TestTimeManagerFixedTimestepImplementations:
     """Tests for fixed timestep implementations in TimeManager source."""
 
-    def test_constructor_initializes_fixed_delta_time(self):
-        """
-        Ensures the TimeManager constructor initializes fixedDeltaTime_
-        in the initializer list.
-        """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        has_init = re.search(r'fixedDeltaTime_\s*\(', content)
-        assert has_init is not None, \
-            "Constructor must initialize fixedDeltaTime_ in initializer list"
-
-    def test_constructor_initializes_fixed_time_accumulator(self):
-        """
-        Validates that the TimeManager constructor initializes 
-        fixedTimeAccumulator_ to 0.0 in the initializer list.
-        """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        has_init = re.search(r'fixedTimeAccumulator_\s*\(\s*0\.0\s*\)', content)
-        assert has_init is not None, \
-            "Constructor must initialize fixedTimeAccumulator_ to 0.0"
+    @pytest.mark.parametrize("pattern,message", [
+        pytest.param(_FIXED_DELTA_TIME_INIT_RE,
+                     "Constructor must initialize fixedDeltaTime_ in initializer list",
+                     id="fixedDeltaTime_"),
+        pytest.param(_FIXED_TIME_ACCUMULATOR_INIT_RE,
+                     "Constructor must initialize fixedTimeAccumulator_ to 0.0",
+                     id="fixedTimeAccumulator_"),
+    ])
+    def test_constructor_initializes_member(self, time_manager_source, pattern, message):
+        """
+        Ensures the TimeManager constructor initializes fixedDeltaTime_ and
+        sets fixedTimeAccumulator_ to 0.0 in the initializer list.
+        """
+        assert pattern.search(time_manager_source) is not None, message
 
-    def test_update_accumulates_fixed_time(self):
+    def test_update_accumulates_fixed_time(self, time_manager_source):
         """
-        Confirms that the update method adds deltaTime_ to 
+        Confirms that the update method adds deltaTime_ to
         fixedTimeAccumulator_ using the += operator.
         """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        update_match = re.search(
-            r'void\s+TimeManager::update\s*\([^)]*\)[^{]*\{(.*?)^void\s+TimeManager::',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert update_match is not None, "update method not found"
-        
-        update_body = update_match.group(1)
+        update_body = extract_body(time_manager_source, _UPDATE_BODY_RE)
+        assert update_body is not None, "update method not found"
+
         has_accumulate = 'fixedTimeAccumulator_' in update_body and '+=' in update_body
         assert has_accumulate, \
             "update must accumulate deltaTime_ into fixedTimeAccumulator_"
 
-    def test_reset_clears_fixed_time_accumulator(self):
+    def test_reset_clears_fixed_time_accumulator(self, time_manager_source):
         """
         Verifies that the reset method sets fixedTimeAccumulator_ to 0.0.
         """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        reset_match = re.search(
-            r'void\s+TimeManager::reset\s*\([^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert reset_match is not None, "reset method not found"
-        
-        reset_body = reset_match.group(1)
+        reset_body = extract_body(time_manager_source, _RESET_BODY_RE)
+        assert reset_body is not None, "reset method not found"
+
         has_reset = 'fixedTimeAccumulator_' in reset_body and '0.0' in reset_body
         assert has_reset, \
             "reset must set fixedTimeAccumulator_ to 0.0"
 
-    def test_consume_fixed_time_step_subtracts(self):
+    def test_consume_fixed_time_step_subtracts(self, time_manager_source):
         """
         Ensures consumeFixedTimeStep subtracts fixedDeltaTime_ from
         fixedTimeAccumulator_ when enough time has accumulated.
         """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        func_match = re.search(
-            r'bool\s+TimeManager::consumeFixedTimeStep\s*\([^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert func_match is not None, "consumeFixedTimeStep method not found"
-        
-        func_body = func_match.group(1)
+        func_body = extract_body(time_manager_source, _CONSUME_FIXED_TIME_STEP_BODY_RE)
+        assert func_body is not None, "consumeFixedTimeStep method not found"
+
         has_subtract = '-=' in func_body and 'fixedDeltaTime_' in func_body
         assert has_subtract, \
             "consumeFixedTimeStep must subtract fixedDeltaTime_ from accumulator"
 
-    def test_get_fixed_update_alpha_divides(self):
+    def test_get_fixed_update_alpha_divides(self, time_manager_source):
         """
         Validates that getFixedUpdateAlpha divides fixedTimeAccumulator_
         by fixedDeltaTime_ to compute the interpolation factor.
         """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        func_match = re.search(
-            r'double\s+TimeManager::getFixedUpdateAlpha\s*\([^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert func_match is not None, "getFixedUpdateAlpha method not found"
-        
-        func_body = func_match.group(1)
+        func_body = extract_body(time_manager_source, _GET_FIXED_UPDATE_ALPHA_BODY_RE)
+        assert func_body is not None, "getFixedUpdateAlpha method not found"
+
         has_divide = '/' in func_body and 'fixedDeltaTime_' in func_body
         assert has_divide, \
             "getFixedUpdateAlpha must divide accumulator by fixedDeltaTime_"
 
 
+_PHYSICS_STATE_CLASS_DECL_RE = re.compile(
+    r'class\s+PhysicsStateComponent\s*:\s*public\s+ComponentBase\s*<\s*PhysicsStateComponent\s*>'
+)
+_PHYSICS_STATE_CLASS_BODY_RE = re.compile(r'class\s+PhysicsStateComponent\b[^{;]*\{')
+_PREVIOUS_X_MEMBER_RE = re.compile(r'float\s+previousX_\s*;')
+_PREVIOUS_Y_MEMBER_RE = re.compile(r'float\s+previousY_\s*;')
+_SAVE_STATE_DECL_RE = re.compile(r'void\s+saveState\s*\(\s*float\s+\w+\s*,\s*float')
+_GET_INTERPOLATED_POSITION_DECL_RE = re.compile(r'void\s+getInterpolatedPosition\s*\(')
+
+
 class TestPhysicsStateComponentDeclaration:
     """Tests for PhysicsStateComponent class declaration."""
 
-    def test_physics_state_component_class_declared(self):
-        """
-        Validates that PhysicsStateComponent class is declared in the header
-        inheriting from ComponentBase<PhysicsStateComponent>.
-        """
-        content = read_file_content('project/include/ecs/component.h')
-        
-        has_class = re.search(
-            r'class\s+PhysicsStateComponent\s*:\s*public\s+ComponentBase\s*<\s*PhysicsStateComponent\s*>',
-            content
-        )
-        assert has_class is not None, \
-            "PhysicsStateComponent must be declared inheriting from ComponentBase"
-
-    def test_previous_position_members_declared(self):
+    @pytest.mark.parametrize("pattern,message", [
+        pytest.param(_PHYSICS_STATE_CLASS_DECL_RE,
+                     "PhysicsStateComponent must be declared inheriting from ComponentBase",
+                     id="PhysicsStateComponent"),
+        pytest.param(_SAVE_STATE_DECL_RE,
+                     "PhysicsStateComponent must declare saveState(float, float) method",
+                     id="saveState"),
+        pytest.param(_GET_INTERPOLATED_POSITION_DECL_RE,
+                     "PhysicsStateComponent must declare getInterpolatedPosition method",
+                     id="getInterpolatedPosition"),
+    ])
+    def test_physics_state_component_declared(self, component_header, pattern, message):
+        """
+        Validates that PhysicsStateComponent is declared inheriting from
+        ComponentBase<PhysicsStateComponent>, with a saveState(float, float)
+        method and a getInterpolatedPosition method.
+        """
+        assert pattern.search(component_header) is not None, message
+
+    def test_previous_position_members_declared(self, component_header):
         """
         Confirms PhysicsStateComponent has previousX_ and previousY_ members
         declared as floats to store the previous physics state.
         """
-        content = read_file_content('project/include/ecs/component.h')
-        
-        class_match = re.search(
-            r'class\s+PhysicsStateComponent[^{]*\{(.*?)\};',
-            content,
-            re.DOTALL
-        )
-        assert class_match is not None, "PhysicsStateComponent class not found"
-        
-        class_body = class_match.group(1)
-        has_prev_x = re.search(r'float\s+previousX_\s*;', class_body)
-        has_prev_y = re.search(r'float\s+previousY_\s*;', class_body)
+        class_body = extract_body(component_header, _PHYSICS_STATE_CLASS_BODY_RE)
+        assert class_body is not None, "PhysicsStateComponent class not found"
+
+        has_prev_x = _PREVIOUS_X_MEMBER_RE.search(class_body)
+        has_prev_y = _PREVIOUS_Y_MEMBER_RE.search(class_body)
         assert has_prev_x and has_prev_y, \
             "PhysicsStateComponent must have previousX_ and previousY_ as float members"
 
-    def test_save_state_method_declared(self):
-        """
-        Verifies that PhysicsStateComponent declares a saveState method
-        taking x and y float parameters.
-        """
-        content = read_file_content('project/include/ecs/component.h')
-        
-        has_method = re.search(
-            r'void\s+saveState\s*\(\s*float\s+\w+\s*,\s*float',
-            content
-        )
-        assert has_method is not None, \
-            "PhysicsStateComponent must declare saveState(float, float) method"
-
-    def test_get_interpolated_position_declared(self):
-        """
-        Confirms that PhysicsStateComponent declares a getInterpolatedPosition
-        method taking alpha and position parameters with output references.
-        """
-        content = read_file_content('project/include/ecs/component.h')
-        
-        has_method = re.search(
-            r'void\s+getInterpolatedPosition\s*\(',
-            content
-        )
-        assert has_method is not None, \
-            "PhysicsStateComponent must declare getInterpolatedPosition method"
+
+_SAVE_STATE_BODY_RE = re.compile(
+    r'void\s+PhysicsStateComponent::saveState\s*\([^)]+\)[^{;]*\{'
+)
+_GET_INTERPOLATED_POSITION_BODY_RE = re.compile(
+    r'void\s+PhysicsStateComponent::getInterpolatedPosition\s*\([^)]+\)[^{;]*\{'
+)
+_GET_PREVIOUS_X_BODY_RE = re.compile(
+    r'float\s+PhysicsStateComponent::getPreviousX\s*\([^)]*\)[^{;]*\{'
+)
+_GET_PREVIOUS_Y_BODY_RE = re.compile(
+    r'float\s+PhysicsStateComponent::getPreviousY\s*\([^)]*\)[^{;]*\{'
+)
 
 
 class TestPhysicsStateComponentMethods:
     """Tests for PhysicsStateComponent method implementations."""
 
-    def test_save_state_assigns_previous_values(self):
+    def test_save_state_assigns_previous_values(self, component_source):
         """
         Ensures saveState implementation assigns the x and y parameters
         to previousX_ and previousY_ members.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        func_match = re.search(
-            r'void\s+PhysicsStateComponent::saveState\s*\([^)]+\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert func_match is not None, "saveState method not found"
-        
-        func_body = func_match.group(1)
+        func_body = extract_body(component_source, _SAVE_STATE_BODY_RE)
+        assert func_body is not None, "saveState method not found"
+
         assigns_x = 'previousX_' in func_body and '=' in func_body
         assigns_y = 'previousY_' in func_body
         assert assigns_x and assigns_y, \
             "saveState must assign parameters to previousX_ and previousY_"
 
-    def test_get_interpolated_position_uses_alpha(self):
+    def test_get_interpolated_position_uses_alpha(self, component_source):
         """
         Validates that getInterpolatedPosition uses the alpha parameter
         to interpolate between previous and current positions.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        func_match = re.search(
-            r'void\s+PhysicsStateComponent::getInterpolatedPosition\s*\([^)]+\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert func_match is not None, "getInterpolatedPosition method not found"
-        
-        func_body = func_match.group(1)
+        func_body = extract_body(component_source, _GET_INTERPOLATED_POSITION_BODY_RE)
+        assert func_body is not None, "getInterpolatedPosition method not found"
+
         uses_alpha = 'alpha' in func_body
         uses_previous = 'previousX_' in func_body or 'previousY_' in func_body
         assert uses_alpha and uses_previous, \
             "getInterpolatedPosition must use alpha and previous position values"
 
-    def test_get_previous_x_returns_member(self):
+    def test_get_previous_x_returns_member(self, component_source):
         """
         Confirms getPreviousX returns the previousX_ member value.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        func_match = re.search(
-            r'float\s+PhysicsStateComponent::getPreviousX\s*\([^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert func_match is not None, "getPreviousX method not found"
-        
-        func_body = func_match.group(1)
+        func_body = extract_body(component_source, _GET_PREVIOUS_X_BODY_RE)
+        assert func_body is not None, "getPreviousX method not found"
+
         returns_member = 'previousX_' in func_body and 'return' in func_body
         assert returns_member, \
             "getPreviousX must return previousX_ member"
 
-    def test_get_previous_y_returns_member(self):
+    def test_get_previous_y_returns_member(self, component_source):
         """
         Confirms getPreviousY returns the previousY_ member value.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        func_match = re.search(
-            r'float\s+PhysicsStateComponent::getPreviousY\s*\([^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert func_match is not None, "getPreviousY method not found"
-        
-        func_body = func_match.group(1)
+        func_body = extract_body(component_source, _GET_PREVIOUS_Y_BODY_RE)
+        assert func_body is not None, "getPreviousY method not found"
+
         returns_member = 'previousY_' in func_body and 'return' in func_body
         assert returns_member, \
             "getPreviousY must return previousY_ member"
@@ -5,198 +5,178 @@ Tests for verifying correct implementation of collision layer filtering in the
 game engine's physics system.
 """
 
-import pytest
 import re
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
 
 
+@lru_cache(maxsize=None)
 def read_file_content(filepath: str) -> str:
-    """Read and return the contents of a source file."""
-    with open(filepath, 'r') as f:
-        return f.read()
+    """Read and return the contents of a source file, once per test session."""
+    return Path(filepath).read_bytes().decode()
+
+
+_BRACE_RE = re.compile(r'[{}]')
+
+
+def find_closing_brace(source: str, start: int) -> int:
+    """
+    Return the index of the '}' that closes a block whose body starts at
+    start, or len(source) if the block is never closed.
+    """
+    depth = 1
+    for brace in _BRACE_RE.finditer(source, start):
+        depth += 1 if brace.group() == '{' else -1
+        if depth == 0:
+            return brace.start()
+    return len(source)
+
+
+def extract_body(source: str, signature: re.Pattern):
+    """
+    Return the block opened by the first match of signature (which must end
+    at the opening '{'), or None if signature does not match.
+    """
+    match = signature.search(source)
+    if match is None:
+        return None
+    return source[match.end():find_closing_brace(source, match.end())]
+
+
+# Literals a DOTALL pattern cannot match without, checked first so that a
+# body missing them fails without a backtracking search.
+_REQUIRED_LITERALS = {}
+
+
+def search_body(body: str, pattern: re.Pattern):
+    """Search body for pattern, skipping the search if a required literal is absent."""
+    if not all(literal in body for literal in _REQUIRED_LITERALS.get(pattern, ())):
+        return None
+    return pattern.search(body)
+
+
+@pytest.fixture(scope="session")
+def collision_source() -> str:
+    return read_file_content('project/src/physics/collision.cpp')
+
+
+@pytest.fixture(scope="session")
+def collision_world_source() -> str:
+    return read_file_content('project/src/physics/collision_world.cpp')
+
+
+_CAN_COLLIDE_WITH_BODY_RE = re.compile(
+    r'bool\s+CollisionMask::canCollideWith\s*\([^)]*\)\s*const\s*\{'
+)
+_REVERSE_LAYER_CHECK_RE = re.compile(r'hasLayer\s*\(\s*other\.collidesWith\s*,\s*layer\s*\)')
+_AND_RETURN_RE = re.compile(r'return\s+[^;]*&&[^;]*;')
+
+
+@pytest.fixture(scope="module")
+def can_collide_with_body(collision_source):
+    return extract_body(collision_source, _CAN_COLLIDE_WITH_BODY_RE)
 
 
 class TestCollisionMaskBidirectionalCheck:
     """Tests for the canCollideWith function implementing bidirectional layer checks."""
 
-    def test_can_collide_with_checks_both_directions(self):
-        """
-        Verifies that canCollideWith performs a bidirectional collision check by
-        examining whether both thisCanHitOther and otherCanHitThis conditions are
-        evaluated and combined with a logical AND operation.
-        """
-        content = read_file_content('project/src/physics/collision.cpp')
-        
-        function_match = re.search(
-            r'bool\s+CollisionMask::canCollideWith\s*\([^)]*\)\s*const\s*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "canCollideWith function not found"
-        
-        function_body = function_match.group(1)
-        
-        has_other_can_hit_this = re.search(
-            r'hasLayer\s*\(\s*other\.collidesWith\s*,\s*layer\s*\)',
-            function_body
-        )
-        assert has_other_can_hit_this is not None, \
-            "Missing reverse direction check: hasLayer(other.collidesWith, layer)"
-
-    def test_can_collide_with_returns_and_of_both_checks(self):
+    @pytest.mark.parametrize("pattern,message", [
+        pytest.param(_REVERSE_LAYER_CHECK_RE,
+                     "Missing reverse direction check: hasLayer(other.collidesWith, layer)",
+                     id="checks_both_directions"),
+        pytest.param(_AND_RETURN_RE,
+                     "Return statement must use && to combine both directional checks",
+                     id="returns_and_of_both_checks"),
+    ])
+    def test_can_collide_with(self, can_collide_with_body, pattern, message):
         """
-        Ensures the canCollideWith function returns the logical AND of both
-        directional checks rather than just one direction.
+        Verifies that canCollideWith performs a bidirectional collision check:
+        it also evaluates hasLayer(other.collidesWith, layer) and returns the
+        logical AND of both directional checks rather than just one direction.
         """
-        content = read_file_content('project/src/physics/collision.cpp')
-        
-        function_match = re.search(
-            r'bool\s+CollisionMask::canCollideWith\s*\([^)]*\)\s*const\s*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "canCollideWith function not found"
-        
-        function_body = function_match.group(1)
-        
-        has_and_return = re.search(
-            r'return\s+[^;]*&&[^;]*;',
-            function_body
-        )
-        assert has_and_return is not None, \
-            "Return statement must use && to combine both directional checks"
+        assert can_collide_with_body is not None, "canCollideWith function not found"
+        assert search_body(can_collide_with_body, pattern) is not None, message
+
+
+_DETECT_COLLISIONS_BODY_RE = re.compile(
+    r'std::vector<CollisionInfo>\s+CollisionWorld::detectCollisions\s*\(\s*\)\s*const\s*\{'
+)
+_GET_COLLISION_MASK_CALL_RE = re.compile(r'\.collider\.getCollisionMask\s*\(\s*\)')
+_CAN_COLLIDE_WITH_CALL_RE = re.compile(r'canCollideWith\s*\(')
+_SKIP_INCOMPATIBLE_LAYERS_RE = re.compile(
+    r'if\s*\(\s*!.*canCollideWith.*\)\s*\{?\s*continue',
+    re.DOTALL
+)
+_REQUIRED_LITERALS[_SKIP_INCOMPATIBLE_LAYERS_RE] = ('canCollideWith', 'continue')
+
+
+@pytest.fixture(scope="module")
+def detect_collisions_body(collision_world_source):
+    return extract_body(collision_world_source, _DETECT_COLLISIONS_BODY_RE)
 
 
 class TestDetectCollisionsLayerFiltering:
     """Tests for collision layer filtering in the detectCollisions function."""
 
-    def test_detect_collisions_checks_layer_masks(self):
-        """
-        Validates that detectCollisions retrieves collision masks from both
-        colliders before adding a collision to the results.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'std::vector<CollisionInfo>\s+CollisionWorld::detectCollisions\s*\(\s*\)\s*const\s*\{(.*?)^\}',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert function_match is not None, "detectCollisions function not found"
-        
-        function_body = function_match.group(1)
-        
-        gets_mask_a = re.search(r'\.collider\.getCollisionMask\s*\(\s*\)', function_body)
-        assert gets_mask_a is not None, \
-            "detectCollisions must retrieve collision masks from colliders"
-
-    def test_detect_collisions_calls_can_collide_with(self):
-        """
-        Confirms that detectCollisions invokes canCollideWith to determine
-        whether two overlapping colliders should actually register a collision.
+    @pytest.mark.parametrize("pattern,message", [
+        pytest.param(_GET_COLLISION_MASK_CALL_RE,
+                     "detectCollisions must retrieve collision masks from colliders",
+                     id="checks_layer_masks"),
+        pytest.param(_CAN_COLLIDE_WITH_CALL_RE,
+                     "detectCollisions must call canCollideWith to filter collisions by layer",
+                     id="calls_can_collide_with"),
+        pytest.param(_SKIP_INCOMPATIBLE_LAYERS_RE,
+                     "detectCollisions must skip pairs that fail canCollideWith check",
+                     id="skips_incompatible_layers"),
+    ])
+    def test_detect_collisions(self, detect_collisions_body, pattern, message):
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'std::vector<CollisionInfo>\s+CollisionWorld::detectCollisions\s*\(\s*\)\s*const\s*\{(.*?)^\}',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert function_match is not None, "detectCollisions function not found"
-        
-        function_body = function_match.group(1)
-        
-        calls_can_collide = re.search(r'canCollideWith\s*\(', function_body)
-        assert calls_can_collide is not None, \
-            "detectCollisions must call canCollideWith to filter collisions by layer"
-
-    def test_detect_collisions_skips_incompatible_layers(self):
+        Validates that detectCollisions retrieves the collision masks of both
+        colliders, invokes canCollideWith on them, and skips collision pairs
+        whose layer masks are incompatible.
         """
-        Verifies that detectCollisions contains logic to skip collision pairs
-        where the layer masks are incompatible.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'std::vector<CollisionInfo>\s+CollisionWorld::detectCollisions\s*\(\s*\)\s*const\s*\{(.*?)^\}',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert function_match is not None, "detectCollisions function not found"
-        
-        function_body = function_match.group(1)
-        
-        has_skip_logic = re.search(
-            r'if\s*\(\s*!.*canCollideWith.*\)\s*\{?\s*continue',
-            function_body,
-            re.DOTALL
-        )
-        assert has_skip_logic is not None, \
-            "detectCollisions must skip pairs that fail canCollideWith check"
+        assert detect_collisions_body is not None, "detectCollisions function not found"
+        assert search_body(detect_collisions_body, pattern) is not None, message
+
+
+_QUERY_AABB_FILTER_BODY_RE = re.compile(
+    r'std::vector<EntityID>\s+CollisionWorld::queryAABB\s*\(\s*const\s+AABB\s*&\s*bounds\s*,\s*CollisionLayer\s+layerFilter\s*\)\s*const\s*\{'
+)
+_HAS_LAYER_FILTER_CALL_RE = re.compile(r'hasLayer\s*\(\s*layerFilter')
+_CONDITIONAL_PUSH_RE = re.compile(
+    r'if\s*\(\s*hasLayer\s*\([^)]*\([^)]*\)[^)]*\)\s*\)\s*\{?\s*results\.push_back',
+    re.DOTALL
+)
+_REQUIRED_LITERALS[_CONDITIONAL_PUSH_RE] = ('hasLayer', 'results.push_back')
+_GET_COLLIDER_LAYER_CALL_RE = re.compile(r'\.collider\.getLayer\s*\(\s*\)')
+
+
+@pytest.fixture(scope="module")
+def query_aabb_filter_body(collision_world_source):
+    return extract_body(collision_world_source, _QUERY_AABB_FILTER_BODY_RE)
 
 
 class TestQueryAABBLayerFiltering:
     """Tests for layer filtering in the queryAABB function."""
 
-    def test_query_aabb_with_filter_checks_layer(self):
+    @pytest.mark.parametrize("pattern,message", [
+        pytest.param(_HAS_LAYER_FILTER_CALL_RE,
+                     "queryAABB must use hasLayer with layerFilter parameter",
+                     id="checks_layer"),
+        pytest.param(_CONDITIONAL_PUSH_RE,
+                     "queryAABB must conditionally add entities based on layer filter",
+                     id="conditionally_adds_entities"),
+        pytest.param(_GET_COLLIDER_LAYER_CALL_RE,
+                     "queryAABB must get each collider's layer for filtering",
+                     id="uses_collider_layer"),
+    ])
+    def test_query_aabb_with_filter(self, query_aabb_filter_body, pattern, message):
         """
         Ensures that the queryAABB overload accepting a layerFilter parameter
-        actually uses that filter to check each collider's layer.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'std::vector<EntityID>\s+CollisionWorld::queryAABB\s*\(\s*const\s+AABB\s*&\s*bounds\s*,\s*CollisionLayer\s+layerFilter\s*\)\s*const\s*\{(.*?)^\}',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert function_match is not None, "queryAABB with layerFilter not found"
-        
-        function_body = function_match.group(1)
-        
-        uses_has_layer = re.search(r'hasLayer\s*\(\s*layerFilter', function_body)
-        assert uses_has_layer is not None, \
-            "queryAABB must use hasLayer with layerFilter parameter"
-
-    def test_query_aabb_with_filter_conditionally_adds_entities(self):
-        """
-        Confirms that queryAABB with a layer filter only adds entities to results
-        when they pass the layer check.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'std::vector<EntityID>\s+CollisionWorld::queryAABB\s*\(\s*const\s+AABB\s*&\s*bounds\s*,\s*CollisionLayer\s+layerFilter\s*\)\s*const\s*\{(.*?)^\}',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert function_match is not None, "queryAABB with layerFilter not found"
-        
-        function_body = function_match.group(1)
-        
-        has_conditional_push = re.search(
-            r'if\s*\(\s*hasLayer\s*\([^)]*\([^)]*\)[^)]*\)\s*\)\s*\{?\s*results\.push_back',
-            function_body,
-            re.DOTALL
-        )
-        assert has_conditional_push is not None, \
-            "queryAABB must conditionally add entities based on layer filter"
-
-    def test_query_aabb_filter_uses_collider_layer(self):
-        """
-        Validates that the layer filter check in queryAABB retrieves each
-        collider's layer via getLayer() for comparison.
+        checks each collider's layer (retrieved via getLayer()) against that
+        filter, and only adds entities to results when they pass the check.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'std::vector<EntityID>\s+CollisionWorld::queryAABB\s*\(\s*const\s+AABB\s*&\s*bounds\s*,\s*CollisionLayer\s+layerFilter\s*\)\s*const\s*\{(.*?)^\}',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert function_match is not None, "queryAABB with layerFilter not found"
-        
-        function_body = function_match.group(1)
-        
-        gets_collider_layer = re.search(r'\.collider\.getLayer\s*\(\s*\)', function_body)
-        assert gets_collider_layer is not None, \
-            "queryAABB must get each collider's layer for filtering"
+        assert query_aabb_filter_body is not None, "queryAABB with layerFilter not found"
+        assert search_body(query_aabb_filter_body, pattern) is not None, message
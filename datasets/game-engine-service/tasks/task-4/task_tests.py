@@ -3,218 +3,230 @@ Component Serialization Task Tests
 """
 
 import re
+from functools import lru_cache
+from pathlib import Path
+
 import pytest
 
 
+@lru_cache(maxsize=None)
 def read_file_content(filepath: str) -> str:
-    """Read and return the contents of a source file."""
-    with open(filepath, 'r') as f:
-        return f.read()
+    """Read and return the contents of a source file, once per test session."""
+    return Path(filepath).read_bytes().decode()
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACING_RE = re.compile(r' ?([^\w ]) ?')
+
+
+def normalize_whitespace(source: str) -> str:
+    """
+    Return source with whitespace runs collapsed to a single space and
+    dropped around punctuation, so that declarations can be matched as
+    plain substrings. This is looser than a whitespace-tolerant regex:
+    spacing the regex would reject, such as 'std:: string' or '} ;', is
+    accepted too.
+    """
+    return _PUNCTUATION_SPACING_RE.sub(r'\1', _WHITESPACE_RE.sub(' ', source))
+
+
+_BRACE_RE = re.compile(r'[{}]')
+
+
+def find_closing_brace(source: str, start: int) -> int:
+    """
+    Return the index of the '}' that closes a block whose body starts at
+    start, or len(source) if the block is never closed.
+    """
+    depth = 1
+    for brace in _BRACE_RE.finditer(source, start):
+        depth += 1 if brace.group() == '{' else -1
+        if depth == 0:
+            return brace.start()
+    return len(source)
+
+
+def extract_body(source: str, signature: re.Pattern):
+    """
+    Return the block opened by the first match of signature (which must end
+    at the opening '{'), or None if signature does not match.
+    """
+    match = signature.search(source)
+    if match is None:
+        return None
+    return source[match.end():find_closing_brace(source, match.end())]
+
+
+@pytest.fixture(scope="session")
+def component_source() -> str:
+    return read_file_content('project/src/ecs/component.cpp')
+
+
+@pytest.fixture(scope="session")
+def component_header() -> str:
+    return read_file_content('project/include/ecs/component.h')
+
+
+@pytest.fixture(scope="session")
+def sprite_header() -> str:
+    return read_file_content('project/include/rendering/sprite.h')
+
+
+@pytest.fixture(scope="session")
+def component_source_normalized(component_source) -> str:
+    return normalize_whitespace(component_source)
+
+
+@pytest.fixture(scope="session")
+def sprite_header_normalized(sprite_header) -> str:
+    return normalize_whitespace(sprite_header)
+
+
+_TRANSFORM_SERIALIZE_DEF = 'std::string TransformComponent::serialize()'
+_TRANSFORM_DESERIALIZE_DEF = 'TransformComponent TransformComponent::deserialize(const std::string&'
+_TRANSFORM_SERIALIZE_BODY_RE = re.compile(
+    r'std::string\s+TransformComponent::serialize\s*\(\s*\)[^{;]*\{'
+)
+_TRANSFORM_DESERIALIZE_BODY_RE = re.compile(
+    r'TransformComponent\s+TransformComponent::deserialize\s*\([^)]+\)[^{;]*\{'
+)
+
+
+@pytest.fixture(scope="module")
+def transform_serialize_body(component_source):
+    return extract_body(component_source, _TRANSFORM_SERIALIZE_BODY_RE)
 
 
 class TestTransformComponentSerialization:
     """Tests for TransformComponent serialize and deserialize methods."""
 
-    def test_transform_has_serialize_method(self):
-        """
-        Verifies TransformComponent declares a serialize method that returns
-        a string containing the position and scale fields.
-        """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        has_serialize = re.search(
-            r'std::string\s+TransformComponent::serialize\s*\(\s*\)',
-            content
-        )
-        assert has_serialize is not None, \
-            "TransformComponent must have serialize() method returning std::string"
-
-    def test_transform_has_deserialize_method(self):
-        """
-        Verifies TransformComponent declares a static deserialize method
-        that accepts a const string reference parameter.
-        """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        has_deserialize = re.search(
-            r'TransformComponent\s+TransformComponent::deserialize\s*\(\s*const\s+std::string\s*&',
-            content
-        )
-        assert has_deserialize is not None, \
-            "TransformComponent must have static deserialize(const std::string&) method"
-
-    def test_transform_serialize_includes_scale_fields(self):
-        """
-        Confirms TransformComponent serialize output contains both scaleX
-        and scaleY field identifiers in the serialized string.
-        """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        function_match = re.search(
-            r'std::string\s+TransformComponent::serialize\s*\(\s*\)[^{]*\{(.*?)\n\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "serialize method not found"
-        
-        function_body = function_match.group(1)
-        has_scale_x = 'scaleX' in function_body
-        has_scale_y = 'scaleY' in function_body
-        assert has_scale_x and has_scale_y, \
-            "TransformComponent serialize must include scaleX and scaleY fields"
-
-    def test_transform_serialize_includes_rotation(self):
-        """
-        Validates that TransformComponent serialize method includes the
-        rotation field in its serialized output.
-        """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        function_match = re.search(
-            r'std::string\s+TransformComponent::serialize\s*\(\s*\)[^{]*\{(.*?)\n\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "serialize method not found"
-        
-        function_body = function_match.group(1)
-        has_rotation = 'rotation' in function_body
-        assert has_rotation, \
-            "TransformComponent serialize must include rotation field"
-
-    def test_transform_deserialize_uses_stringstream(self):
+    @pytest.mark.parametrize("definition,message", [
+        pytest.param(_TRANSFORM_SERIALIZE_DEF,
+                     "TransformComponent must have serialize() method returning std::string",
+                     id="serialize"),
+        pytest.param(_TRANSFORM_DESERIALIZE_DEF,
+                     "TransformComponent must have static deserialize(const std::string&) method",
+                     id="deserialize"),
+    ])
+    def test_transform_has_method(self, component_source_normalized, definition, message):
+        """
+        Verifies TransformComponent defines a serialize method returning a
+        string and a static deserialize method that accepts a const string
+        reference parameter.
+        """
+        assert definition in component_source_normalized, message
+
+    @pytest.mark.parametrize("fields,message", [
+        pytest.param(('scaleX', 'scaleY'),
+                     "TransformComponent serialize must include scaleX and scaleY fields",
+                     id="scale_fields"),
+        pytest.param(('rotation',),
+                     "TransformComponent serialize must include rotation field",
+                     id="rotation"),
+    ])
+    def test_transform_serialize_includes(self, transform_serialize_body, fields, message):
+        """
+        Confirms TransformComponent serialize output contains the scaleX,
+        scaleY and rotation field identifiers in the serialized string.
+        """
+        assert transform_serialize_body is not None, "serialize method not found"
+        assert all(field in transform_serialize_body for field in fields), message
+
+    def test_transform_deserialize_uses_stringstream(self, component_source):
         """
         Confirms TransformComponent deserialize uses stringstream for
         parsing the serialized data.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        function_match = re.search(
-            r'TransformComponent\s+TransformComponent::deserialize\s*\([^)]+\)[^{]*\{(.*?)\n\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "deserialize method not found"
-        
-        function_body = function_match.group(1)
+        function_body = extract_body(component_source, _TRANSFORM_DESERIALIZE_BODY_RE)
+        assert function_body is not None, "deserialize method not found"
         has_stringstream = 'istringstream' in function_body or 'stringstream' in function_body
         assert has_stringstream, \
             "TransformComponent deserialize should use stringstream for parsing"
 
 
+_TAG_SERIALIZE_BODY_RE = re.compile(r'std::string\s+TagComponent::serialize\s*\(\s*\)[^{;]*\{')
+_TAG_DESERIALIZE_DEF = 'TagComponent TagComponent::deserialize(const std::string&'
+_TAG_CLASS_BODY_RE = re.compile(r'class\s+TagComponent\b[^{;]*\{')
+_TAG_FIELD_RE = re.compile(r'tag', re.IGNORECASE)
+
+
 class TestTagComponentSerialization:
     """Tests for TagComponent serialize and deserialize methods."""
 
-    def test_tag_has_serialize_method(self):
+    def test_tag_has_serialize_method(self, component_source):
         """
         Verifies TagComponent has a serialize method that includes the tag
         field identifier in its output.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        function_match = re.search(
-            r'std::string\s+TagComponent::serialize\s*\(\s*\)[^{]*\{(.*?)\n\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, \
+        function_body = extract_body(component_source, _TAG_SERIALIZE_BODY_RE)
+        assert function_body is not None, \
             "TagComponent must have serialize() method"
-        
-        function_body = function_match.group(1)
-        has_tag = 'tag' in function_body.lower()
+        has_tag = _TAG_FIELD_RE.search(function_body) is not None
         assert has_tag, "TagComponent serialize must include tag field"
 
-    def test_tag_has_deserialize_method(self):
+    def test_tag_has_deserialize_method(self, component_source_normalized):
         """
         Confirms TagComponent has a static deserialize method that accepts
         a const string reference and returns a TagComponent.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        has_deserialize = re.search(
-            r'TagComponent\s+TagComponent::deserialize\s*\(\s*const\s+std::string\s*&',
-            content
-        )
-        assert has_deserialize is not None, \
+        has_deserialize = _TAG_DESERIALIZE_DEF in component_source_normalized
+        assert has_deserialize, \
             "TagComponent must have static deserialize(const std::string&) method"
 
-    def test_tag_serialize_declaration_in_header(self):
+    def test_tag_serialize_declaration_in_header(self, component_header):
         """
         Confirms TagComponent serialize method is declared in the header
         file with correct return type.
         """
-        content = read_file_content('project/include/ecs/component.h')
-        
-        tag_class_match = re.search(
-            r'class\s+TagComponent[^{]*\{(.*?)\};',
-            content,
-            re.DOTALL
-        )
-        assert tag_class_match is not None, "TagComponent class not found"
-        
-        class_body = tag_class_match.group(1)
+        class_body = extract_body(component_header, _TAG_CLASS_BODY_RE)
+        assert class_body is not None, "TagComponent class not found"
         has_serialize_decl = 'serialize' in class_body
         assert has_serialize_decl, \
             "TagComponent must declare serialize() in header file"
 
 
+_SPRITE_SERIALIZE_DECL = 'std::string serialize()'
+_SPRITE_DESERIALIZE_DECL = 'static Sprite deserialize(const std::string&'
+_SPRITE_SERIALIZE_BODY_RE = re.compile(r'std::string\s+serialize\s*\(\s*\)[^{;]*\{')
+_RECT_WIDTH_RE = re.compile(r'(?i:width)|sourceRect_')
+_RECT_HEIGHT_RE = re.compile(r'(?i:height)|sourceRect_')
+
+
 class TestSpriteSerialization:
     """Tests for Sprite serialize and deserialize methods."""
 
-    def test_sprite_has_serialize_method(self):
-        """
-        Verifies Sprite class has a serialize method that returns a string.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        
-        has_serialize = re.search(
-            r'std::string\s+serialize\s*\(\s*\)',
-            content
-        )
-        assert has_serialize is not None, \
-            "Sprite must have serialize() method returning std::string"
-
-    def test_sprite_has_deserialize_method(self):
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_SPRITE_SERIALIZE_DECL,
+                     "Sprite must have serialize() method returning std::string",
+                     id="serialize"),
+        pytest.param(_SPRITE_DESERIALIZE_DECL,
+                     "Sprite must have static deserialize(const std::string&) method",
+                     id="deserialize"),
+    ])
+    def test_sprite_has_method(self, sprite_header_normalized, declaration, message):
         """
-        Confirms Sprite class has a static deserialize method accepting
-        a const string reference.
+        Verifies Sprite class has a serialize method that returns a string
+        and a static deserialize method accepting a const string reference.
         """
-        content = read_file_content('project/include/rendering/sprite.h')
-        
-        has_deserialize = re.search(
-            r'static\s+Sprite\s+deserialize\s*\(\s*const\s+std::string\s*&',
-            content
-        )
-        assert has_deserialize is not None, \
-            "Sprite must have static deserialize(const std::string&) method"
+        assert declaration in sprite_header_normalized, message
 
-    def test_sprite_serialize_includes_rect_dimensions(self):
+    def test_sprite_serialize_includes_rect_dimensions(self, sprite_header):
         """
         Validates that Sprite serialize method includes the sourceRect
         dimensions by checking for width and height references.
         """
-        content = read_file_content('project/include/rendering/sprite.h')
-        
-        function_match = re.search(
-            r'std::string\s+serialize\s*\(\s*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "serialize method not found"
-        
-        function_body = function_match.group(1)
-        has_width = 'width' in function_body.lower() or 'sourceRect_' in function_body
-        has_height = 'height' in function_body.lower() or 'sourceRect_' in function_body
+        function_body = extract_body(sprite_header, _SPRITE_SERIALIZE_BODY_RE)
+        assert function_body is not None, "serialize method not found"
+        has_width = _RECT_WIDTH_RE.search(function_body) is not None
+        has_height = _RECT_HEIGHT_RE.search(function_body) is not None
         assert has_width and has_height, \
             "Sprite serialize must include sourceRect dimensions"
 
-    def test_sprite_serialize_uses_stringstream(self):
+    def test_sprite_serialize_uses_stringstream(self, sprite_header):
         """
         Confirms Sprite serialize uses ostringstream for building the
         serialized output string.
         """
-        content = read_file_content('project/include/rendering/sprite.h')
-        
-        has_ostringstream = 'ostringstream' in content
+        has_ostringstream = 'ostringstream' in sprite_header
         assert has_ostringstream, \
             "Sprite serialize should use ostringstream for building output"
@@ -6,252 +6,264 @@ in the game engine's ECS and collision systems.
 """
 
 import re
+from functools import lru_cache
+from pathlib import Path
+
 import pytest
 
 
+@lru_cache(maxsize=None)
 def read_file_content(filepath: str) -> str:
-    """Read and return the contents of a source file."""
-    with open(filepath, 'r') as f:
-        return f.read()
+    """Read and return the contents of a source file, once per test session."""
+    return Path(filepath).read_bytes().decode()
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACING_RE = re.compile(r' ?([^\w ]) ?')
+
+
+def normalize_whitespace(source: str) -> str:
+    """
+    Return source with whitespace runs collapsed to a single space and
+    dropped around punctuation, so that declarations can be matched as
+    plain substrings. This is looser than a whitespace-tolerant regex:
+    spacing the regex would reject, such as 'std:: string' or '} ;', is
+    accepted too.
+    """
+    return _PUNCTUATION_SPACING_RE.sub(r'\1', _WHITESPACE_RE.sub(' ', source))
+
+
+_BRACE_RE = re.compile(r'[{}]')
+
+
+def find_closing_brace(source: str, start: int) -> int:
+    """
+    Return the index of the '}' that closes a block whose body starts at
+    start, or len(source) if the block is never closed.
+    """
+    depth = 1
+    for brace in _BRACE_RE.finditer(source, start):
+        depth += 1 if brace.group() == '{' else -1
+        if depth == 0:
+            return brace.start()
+    return len(source)
+
+
+def extract_body(source: str, signature: re.Pattern):
+    """
+    Return the block opened by the first match of signature (which must end
+    at the opening '{'), or None if signature does not match.
+    """
+    match = signature.search(source)
+    if match is None:
+        return None
+    return source[match.end():find_closing_brace(source, match.end())]
+
+
+@pytest.fixture(scope="session")
+def collision_world_source() -> str:
+    return read_file_content('project/src/physics/collision_world.cpp')
+
+
+@pytest.fixture(scope="session")
+def collision_world_header() -> str:
+    return read_file_content('project/include/physics/collision_world.h')
+
+
+@pytest.fixture(scope="session")
+def component_source() -> str:
+    return read_file_content('project/src/ecs/component.cpp')
+
+
+@pytest.fixture(scope="session")
+def component_header() -> str:
+    return read_file_content('project/include/ecs/component.h')
+
+
+@pytest.fixture(scope="session")
+def component_source_normalized(component_source) -> str:
+    return normalize_whitespace(component_source)
+
+
+@pytest.fixture(scope="session")
+def component_header_normalized(component_header) -> str:
+    return normalize_whitespace(component_header)
+
+
+_HIERARCHY_CLASS_DECL = 'class HierarchyComponent:public ComponentBase<HierarchyComponent>'
+_HIERARCHY_CLASS_BODY_RE = re.compile(r'class\s+HierarchyComponent\b[^{;]*\{')
+_PARENT_FIELD_RE = re.compile(r'EntityID\s+parent_')
+_CHILDREN_VECTOR_RE = re.compile(r'std::vector\s*<\s*EntityID\s*>\s+children_')
+
+
+@pytest.fixture(scope="module")
+def hierarchy_class_body(component_header):
+    return extract_body(component_header, _HIERARCHY_CLASS_BODY_RE)
 
 
 class TestHierarchyComponentDeclaration:
     """Tests for HierarchyComponent class declaration in component.h."""
 
-    def test_hierarchy_component_class_declared(self):
+    def test_hierarchy_component_class_declared(self, component_header_normalized):
         """
         Verifies that HierarchyComponent class is declared in the header file
         as a new component type for managing parent-child relationships.
         """
-        content = read_file_content('project/include/ecs/component.h')
-        
-        has_class = re.search(
-            r'class\s+HierarchyComponent\s*:\s*public\s+ComponentBase\s*<\s*HierarchyComponent\s*>',
-            content
-        )
-        assert has_class is not None, \
+        has_class = _HIERARCHY_CLASS_DECL in component_header_normalized
+        assert has_class, \
             "HierarchyComponent class must be declared inheriting from ComponentBase<HierarchyComponent>"
 
-    def test_hierarchy_has_parent_field(self):
-        """
-        Confirms HierarchyComponent has a parent_ member field of type EntityID
-        to store the parent entity reference.
-        """
-        content = read_file_content('project/include/ecs/component.h')
-        
-        class_match = re.search(
-            r'class\s+HierarchyComponent[^{]*\{(.*?)\};',
-            content,
-            re.DOTALL
-        )
-        assert class_match is not None, "HierarchyComponent class not found"
-        
-        class_body = class_match.group(1)
-        has_parent_field = re.search(r'EntityID\s+parent_', class_body)
-        assert has_parent_field is not None, \
-            "HierarchyComponent must have parent_ field of type EntityID"
-
-    def test_hierarchy_has_children_vector(self):
+    @pytest.mark.parametrize("pattern,message", [
+        pytest.param(_PARENT_FIELD_RE,
+                     "HierarchyComponent must have parent_ field of type EntityID",
+                     id="parent_field"),
+        pytest.param(_CHILDREN_VECTOR_RE,
+                     "HierarchyComponent must have children_ field as vector<EntityID>",
+                     id="children_vector"),
+    ])
+    def test_hierarchy_has_member(self, hierarchy_class_body, pattern, message):
         """
-        Validates that HierarchyComponent has a children_ member as a vector
-        of EntityID to store references to child entities.
+        Confirms HierarchyComponent has a parent_ member of type EntityID and
+        a children_ member as a vector of EntityID to store the parent and
+        child entity references.
         """
-        content = read_file_content('project/include/ecs/component.h')
-        
-        class_match = re.search(
-            r'class\s+HierarchyComponent[^{]*\{(.*?)\};',
-            content,
-            re.DOTALL
-        )
-        assert class_match is not None, "HierarchyComponent class not found"
-        
-        class_body = class_match.group(1)
-        has_children_vector = re.search(
-            r'std::vector\s*<\s*EntityID\s*>\s+children_',
-            class_body
-        )
-        assert has_children_vector is not None, \
-            "HierarchyComponent must have children_ field as vector<EntityID>"
+        assert hierarchy_class_body is not None, "HierarchyComponent class not found"
+        assert pattern.search(hierarchy_class_body) is not None, message
+
+
+_HIERARCHY_GET_PARENT_DEF = 'EntityID HierarchyComponent::getParent()const'
+_HIERARCHY_SET_PARENT_DEF = 'void HierarchyComponent::setParent(EntityID'
+_ADD_CHILD_BODY_RE = re.compile(
+    r'void\s+HierarchyComponent::addChild\s*\(\s*EntityID[^)]*\)[^{;]*\{'
+)
+_REMOVE_CHILD_BODY_RE = re.compile(
+    r'void\s+HierarchyComponent::removeChild\s*\(\s*EntityID[^)]*\)[^{;]*\{'
+)
+_HAS_PARENT_BODY_RE = re.compile(r'bool\s+HierarchyComponent::hasParent\s*\(\s*\)\s*const[^{;]*\{')
 
 
 class TestHierarchyComponentMethods:
     """Tests for HierarchyComponent method implementations in component.cpp."""
 
-    def test_hierarchy_get_parent_method(self):
-        """
-        Verifies that HierarchyComponent has a getParent method that returns
-        the parent EntityID stored in the component.
+    @pytest.mark.parametrize("definition,message", [
+        pytest.param(_HIERARCHY_GET_PARENT_DEF,
+                     "HierarchyComponent must have getParent() method returning EntityID",
+                     id="get_parent"),
+        pytest.param(_HIERARCHY_SET_PARENT_DEF,
+                     "HierarchyComponent must have setParent(EntityID) method",
+                     id="set_parent"),
+    ])
+    def test_hierarchy_parent_accessor(self, component_source_normalized, definition, message):
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        has_get_parent = re.search(
-            r'EntityID\s+HierarchyComponent::getParent\s*\(\s*\)\s*const',
-            content
-        )
-        assert has_get_parent is not None, \
-            "HierarchyComponent must have getParent() method returning EntityID"
-
-    def test_hierarchy_set_parent_method(self):
+        Verifies that HierarchyComponent has a getParent method returning the
+        stored parent EntityID and a setParent method accepting an EntityID
+        parameter to update the parent relationship.
         """
-        Confirms HierarchyComponent has a setParent method that accepts an
-        EntityID parameter to update the parent relationship.
-        """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        has_set_parent = re.search(
-            r'void\s+HierarchyComponent::setParent\s*\(\s*EntityID',
-            content
-        )
-        assert has_set_parent is not None, \
-            "HierarchyComponent must have setParent(EntityID) method"
-
-    def test_hierarchy_add_child_method(self):
+        assert definition in component_source_normalized, message
+
+    def test_hierarchy_add_child_method(self, component_source):
         """
         Validates that HierarchyComponent has an addChild method that adds
         a child EntityID to the children vector.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        function_match = re.search(
-            r'void\s+HierarchyComponent::addChild\s*\(\s*EntityID[^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "addChild method not found"
-        
-        function_body = function_match.group(1)
+        function_body = extract_body(component_source, _ADD_CHILD_BODY_RE)
+        assert function_body is not None, "addChild method not found"
         uses_push_back = 'push_back' in function_body or 'emplace_back' in function_body
         assert uses_push_back, \
             "addChild must use push_back or emplace_back to add child to vector"
 
-    def test_hierarchy_remove_child_method(self):
+    def test_hierarchy_remove_child_method(self, component_source):
         """
         Ensures HierarchyComponent has a removeChild method that removes a
         child from the children vector using proper removal technique.
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        function_match = re.search(
-            r'void\s+HierarchyComponent::removeChild\s*\(\s*EntityID[^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "removeChild method not found"
-        
-        function_body = function_match.group(1)
+        function_body = extract_body(component_source, _REMOVE_CHILD_BODY_RE)
+        assert function_body is not None, "removeChild method not found"
         uses_remove = 'remove' in function_body or 'erase' in function_body
         assert uses_remove, \
             "removeChild must use std::remove or erase to remove child from vector"
 
-    def test_hierarchy_has_parent_check(self):
+    def test_hierarchy_has_parent_check(self, component_source):
         """
         Verifies HierarchyComponent has a hasParent method that returns true
         when the entity has a valid parent (parent_ != 0).
         """
-        content = read_file_content('project/src/ecs/component.cpp')
-        
-        function_match = re.search(
-            r'bool\s+HierarchyComponent::hasParent\s*\(\s*\)\s*const[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "hasParent method not found"
-        
-        function_body = function_match.group(1)
+        function_body = extract_body(component_source, _HAS_PARENT_BODY_RE)
+        assert function_body is not None, "hasParent method not found"
         checks_parent = 'parent_' in function_body and ('!= 0' in function_body or '> 0' in function_body or '!=' in function_body)
         assert checks_parent, \
             "hasParent must check if parent_ is not zero"
 
 
+_PARENT_MAP_RE = re.compile(r'std::unordered_map\s*<\s*EntityID\s*,\s*EntityID\s*>\s+parentMap_')
+_SET_HIERARCHY_BODY_RE = re.compile(
+    r'void\s+CollisionWorld::setHierarchy\s*\(\s*EntityID[^,]*,\s*EntityID[^)]*\)[^{;]*\{'
+)
+_WORLD_GET_PARENT_BODY_RE = re.compile(
+    r'EntityID\s+CollisionWorld::getParent\s*\(\s*EntityID[^)]*\)\s*const[^{;]*\{'
+)
+_GET_WORLD_POSITION_BODY_RE = re.compile(r'CollisionWorld::getWorldPosition\s*\([^)]*\)[^{;]*\{')
+_PARENT_REFERENCE_RE = re.compile(r'parent', re.IGNORECASE)
+_POSITION_REFERENCE_RE = re.compile(r'pos', re.IGNORECASE)
+
+
+@pytest.fixture(scope="module")
+def get_world_position_body(collision_world_source):
+    return extract_body(collision_world_source, _GET_WORLD_POSITION_BODY_RE)
+
+
 class TestCollisionWorldHierarchy:
     """Tests for hierarchy support in CollisionWorld."""
 
-    def test_collision_world_has_parent_map(self):
+    def test_collision_world_has_parent_map(self, collision_world_header):
         """
         Validates that CollisionWorld declares a parentMap_ member to store
         entity parent relationships as an unordered_map.
         """
-        content = read_file_content('project/include/physics/collision_world.h')
-        
-        has_parent_map = re.search(
-            r'std::unordered_map\s*<\s*EntityID\s*,\s*EntityID\s*>\s+parentMap_',
-            content
-        )
+        has_parent_map = _PARENT_MAP_RE.search(collision_world_header)
         assert has_parent_map is not None, \
             "CollisionWorld must have parentMap_ as unordered_map<EntityID, EntityID>"
 
-    def test_collision_world_set_hierarchy_method(self):
+    def test_collision_world_set_hierarchy_method(self, collision_world_source):
         """
         Confirms CollisionWorld has a setHierarchy method that updates the
         parent relationship in parentMap_ for a given entity.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'void\s+CollisionWorld::setHierarchy\s*\(\s*EntityID[^,]*,\s*EntityID[^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "setHierarchy method not found"
-        
-        function_body = function_match.group(1)
+        function_body = extract_body(collision_world_source, _SET_HIERARCHY_BODY_RE)
+        assert function_body is not None, "setHierarchy method not found"
         updates_map = 'parentMap_' in function_body
         assert updates_map, \
             "setHierarchy must update parentMap_ with the parent relationship"
 
-    def test_collision_world_get_parent_method(self):
+    def test_collision_world_get_parent_method(self, collision_world_source):
         """
         Verifies CollisionWorld has a getParent method that looks up and
         returns the parent EntityID from parentMap_.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'EntityID\s+CollisionWorld::getParent\s*\(\s*EntityID[^)]*\)\s*const[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert function_match is not None, "getParent method not found"
-        
-        function_body = function_match.group(1)
+        function_body = extract_body(collision_world_source, _WORLD_GET_PARENT_BODY_RE)
+        assert function_body is not None, "getParent method not found"
         uses_parent_map = 'parentMap_' in function_body
         assert uses_parent_map, \
             "getParent must query parentMap_ to find parent"
 
-    def test_collision_world_get_world_position_traverses(self):
+    def test_collision_world_get_world_position_traverses(self, get_world_position_body):
         """
         Ensures getWorldPosition method traverses up the hierarchy chain,
         accumulating position offsets from each parent entity.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'CollisionWorld::getWorldPosition\s*\([^)]*\)[^{]*\{(.*?)^\}',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert function_match is not None, "getWorldPosition method not found"
-        
-        function_body = function_match.group(1)
-        traverses_hierarchy = ('while' in function_body or 'for' in function_body) and 'parent' in function_body.lower()
+        function_body = get_world_position_body
+        assert function_body is not None, "getWorldPosition method not found"
+        traverses_hierarchy = ('while' in function_body or 'for' in function_body) and _PARENT_REFERENCE_RE.search(function_body) is not None
         assert traverses_hierarchy, \
             "getWorldPosition must traverse hierarchy using a loop to accumulate positions"
 
-    def test_collision_world_get_world_position_accumulates(self):
+    def test_collision_world_get_world_position_accumulates(self, get_world_position_body):
         """
         Validates that getWorldPosition accumulates x and y positions from
         each collider as it walks up the parent chain.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        function_match = re.search(
-            r'CollisionWorld::getWorldPosition\s*\([^)]*\)[^{]*\{(.*?)^\}',
-            content,
-            re.DOTALL | re.MULTILINE
-        )
-        assert function_match is not None, "getWorldPosition method not found"
-        
-        function_body = function_match.group(1)
-        accumulates_position = ('+=' in function_body or ('x' in function_body and 'y' in function_body and 'pos' in function_body.lower()))
+        function_body = get_world_position_body
+        assert function_body is not None, "getWorldPosition method not found"
+        accumulates_position = ('+=' in function_body or ('x' in function_body and 'y' in function_body and _POSITION_REFERENCE_RE.search(function_body) is not None))
         assert accumulates_position, \
             "getWorldPosition must accumulate x and y positions from hierarchy"
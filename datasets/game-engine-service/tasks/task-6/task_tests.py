@@ -1,260 +1,256 @@
 import re
+from functools import lru_cache
+from pathlib import Path
+
 import pytest
 
 
+@lru_cache(maxsize=None)
 def read_file_content(filepath: str) -> str:
-    with open(filepath, 'r') as f:
-        return f.read()
+    """Read and return the contents of a source file, once per test session."""
+    return Path(filepath).read_bytes().decode()
 
 
-class TestQuadTreeNodeDeclarations:
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACING_RE = re.compile(r' ?([^\w ]) ?')
 
-    def test_quadtree_node_struct_declared(self):
-        """
-        Validates QuadTreeNode struct is declared in collision.h.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'struct\s+QuadTreeNode\s*\{', content) is not None, \
-            "QuadTreeNode struct must be declared"
 
-    def test_quadtree_node_has_bounds_member(self):
-        """
-        Checks QuadTreeNode has bounds AABB member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'AABB\s+bounds\s*;', content) is not None, \
-            "QuadTreeNode must have bounds member"
+def normalize_whitespace(source: str) -> str:
+    """
+    Return source with whitespace runs collapsed to a single space and
+    dropped around punctuation, so that declarations can be matched as
+    plain substrings. This is looser than a whitespace-tolerant regex:
+    spacing the regex would reject, such as 'std:: string' or '} ;', is
+    accepted too.
+    """
+    return _PUNCTUATION_SPACING_RE.sub(r'\1', _WHITESPACE_RE.sub(' ', source))
 
-    def test_quadtree_node_has_entities_member(self):
-        """
-        Checks QuadTreeNode has entities vector member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'std::vector<EntityID>\s+entities\s*;', content) is not None, \
-            "QuadTreeNode must have entities vector member"
 
-    def test_quadtree_node_has_children_member(self):
-        """
-        Checks QuadTreeNode has children vector of pointers member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'std::vector<QuadTreeNode\s*\*>\s+children\s*;', content) is not None, \
-            "QuadTreeNode must have children vector member"
+def has_declaration(source: str, normalized: str, declaration) -> bool:
+    """
+    Return whether source contains declaration, given either as a fixed
+    string looked up in the whitespace-normalized source or as a compiled
+    pattern searched in the raw source.
+    """
+    if isinstance(declaration, str):
+        return declaration in normalized
+    return declaration.search(source) is not None
 
-    def test_quadtree_node_has_depth_member(self):
-        """
-        Checks QuadTreeNode has depth int member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'int\s+depth\s*;', content) is not None, \
-            "QuadTreeNode must have depth member"
 
-    def test_quadtree_node_has_max_entities_member(self):
-        """
-        Checks QuadTreeNode has maxEntities size_t member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'size_t\s+maxEntities\s*;', content) is not None, \
-            "QuadTreeNode must have maxEntities member"
+@pytest.fixture(scope="session")
+def collision_header() -> str:
+    return read_file_content('project/include/physics/collision.h')
 
-    def test_quadtree_node_has_constructor(self):
-        """
-        Validates QuadTreeNode has constructor taking AABB reference and depth.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'QuadTreeNode\s*\(\s*const\s+AABB\s*&[^)]*,\s*int\s+depth\s*=\s*0\s*\)', content) is not None, \
-            "QuadTreeNode must have constructor with AABB& and int depth=0"
 
-    def test_quadtree_node_has_insert_method(self):
-        """
-        Checks QuadTreeNode declares insert method.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'void\s+insert\s*\(\s*EntityID\s+entityId\s*,\s*const\s+AABB\s*&\s+entityBounds\s*\)', content) is not None, \
-            "QuadTreeNode must declare insert method"
+@pytest.fixture(scope="session")
+def collision_world_header() -> str:
+    return read_file_content('project/include/physics/collision_world.h')
 
-    def test_quadtree_node_has_subdivide_method(self):
-        """
-        Checks QuadTreeNode declares subdivide method.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'void\s+subdivide\s*\(\s*\)', content) is not None, \
-            "QuadTreeNode must declare subdivide method"
 
-    def test_quadtree_node_has_clear_method(self):
-        """
-        Checks QuadTreeNode declares clear method.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'void\s+clear\s*\(\s*\)', content) is not None, \
-            "QuadTreeNode must declare clear method"
+@pytest.fixture(scope="session")
+def collision_world_source() -> str:
+    return read_file_content('project/src/physics/collision_world.cpp')
 
-    def test_quadtree_node_has_query_method(self):
-        """
-        Checks QuadTreeNode declares query method returning vector of EntityID.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'std::vector<EntityID>\s+query\s*\(\s*const\s+AABB\s*&\s+queryBounds\s*\)\s*const', content) is not None, \
-            "QuadTreeNode must declare query method"
 
-    def test_quadtree_node_has_is_leaf_method(self):
-        """
-        Checks QuadTreeNode declares isLeaf method.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        assert re.search(r'bool\s+isLeaf\s*\(\s*\)\s*const', content) is not None, \
-            "QuadTreeNode must declare isLeaf method"
+@pytest.fixture(scope="session")
+def collision_header_normalized(collision_header) -> str:
+    return normalize_whitespace(collision_header)
 
 
-class TestCollisionWorldSpatialPartition:
+@pytest.fixture(scope="session")
+def collision_world_header_normalized(collision_world_header) -> str:
+    return normalize_whitespace(collision_world_header)
 
-    def test_collision_world_has_spatial_partition_member(self):
-        """
-        Validates CollisionWorld has spatialPartition_ pointer member.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        assert re.search(r'QuadTreeNode\s*\*\s*spatialPartition_\s*;', content) is not None, \
-            "CollisionWorld must have spatialPartition_ member"
 
-    def test_collision_world_has_world_bounds_member(self):
-        """
-        Checks CollisionWorld has worldBounds_ AABB member.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        assert re.search(r'AABB\s+worldBounds_\s*;', content) is not None, \
-            "CollisionWorld must have worldBounds_ member"
+@pytest.fixture(scope="session")
+def collision_world_source_normalized(collision_world_source) -> str:
+    return normalize_whitespace(collision_world_source)
 
-    def test_collision_world_has_use_spatial_partition_member(self):
-        """
-        Checks CollisionWorld has useSpatialPartition_ bool member.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        assert re.search(r'bool\s+useSpatialPartition_\s*;', content) is not None, \
-            "CollisionWorld must have useSpatialPartition_ member"
 
-    def test_collision_world_has_set_spatial_partition_bounds_method(self):
-        """
-        Validates CollisionWorld declares setSpatialPartitionBounds method.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        assert re.search(r'void\s+setSpatialPartitionBounds\s*\(\s*const\s+AABB\s*&\s+bounds\s*\)', content) is not None, \
-            "CollisionWorld must declare setSpatialPartitionBounds method"
+_QUADTREE_NODE_STRUCT = 'struct QuadTreeNode{'
+_BOUNDS_MEMBER = 'AABB bounds;'
+_ENTITIES_MEMBER_RE = re.compile(r'std::vector<EntityID>\s+entities\s*;')
+_CHILDREN_MEMBER_RE = re.compile(r'std::vector<QuadTreeNode\s*\*>\s+children\s*;')
+_DEPTH_MEMBER = 'int depth;'
+_MAX_ENTITIES_MEMBER = 'size_t maxEntities;'
+_QUADTREE_NODE_CONSTRUCTOR_RE = re.compile(
+    r'QuadTreeNode\s*\(\s*const\s+AABB\s*&[^)]*,\s*int\s+depth\s*=\s*0\s*\)'
+)
+_INSERT_DECL_RE = re.compile(
+    r'void\s+insert\s*\(\s*EntityID\s+entityId\s*,\s*const\s+AABB\s*&\s+entityBounds\s*\)'
+)
+_SUBDIVIDE_DECL = 'void subdivide()'
+_CLEAR_DECL = 'void clear()'
+_QUERY_DECL_RE = re.compile(
+    r'std::vector<EntityID>\s+query\s*\(\s*const\s+AABB\s*&\s+queryBounds\s*\)\s*const'
+)
+_IS_LEAF_DECL = 'bool isLeaf()const'
 
-    def test_collision_world_has_enable_spatial_partition_method(self):
-        """
-        Validates CollisionWorld declares enableSpatialPartition method.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        assert re.search(r'void\s+enableSpatialPartition\s*\(\s*bool\s+enable\s*\)', content) is not None, \
-            "CollisionWorld must declare enableSpatialPartition method"
 
-    def test_collision_world_has_is_spatial_partition_enabled_method(self):
-        """
-        Checks CollisionWorld declares isSpatialPartitionEnabled method.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        assert re.search(r'bool\s+isSpatialPartitionEnabled\s*\(\s*\)\s*const', content) is not None, \
-            "CollisionWorld must declare isSpatialPartitionEnabled method"
+class TestQuadTreeNodeDeclarations:
+
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_QUADTREE_NODE_STRUCT,
+                     "QuadTreeNode struct must be declared",
+                     id="struct_declared"),
+        pytest.param(_BOUNDS_MEMBER,
+                     "QuadTreeNode must have bounds member",
+                     id="has_bounds_member"),
+        pytest.param(_ENTITIES_MEMBER_RE,
+                     "QuadTreeNode must have entities vector member",
+                     id="has_entities_member"),
+        pytest.param(_CHILDREN_MEMBER_RE,
+                     "QuadTreeNode must have children vector member",
+                     id="has_children_member"),
+        pytest.param(_DEPTH_MEMBER,
+                     "QuadTreeNode must have depth member",
+                     id="has_depth_member"),
+        pytest.param(_MAX_ENTITIES_MEMBER,
+                     "QuadTreeNode must have maxEntities member",
+                     id="has_max_entities_member"),
+        pytest.param(_QUADTREE_NODE_CONSTRUCTOR_RE,
+                     "QuadTreeNode must have constructor with AABB& and int depth=0",
+                     id="has_constructor"),
+        pytest.param(_INSERT_DECL_RE,
+                     "QuadTreeNode must declare insert method",
+                     id="has_insert_method"),
+        pytest.param(_SUBDIVIDE_DECL,
+                     "QuadTreeNode must declare subdivide method",
+                     id="has_subdivide_method"),
+        pytest.param(_CLEAR_DECL,
+                     "QuadTreeNode must declare clear method",
+                     id="has_clear_method"),
+        pytest.param(_QUERY_DECL_RE,
+                     "QuadTreeNode must declare query method",
+                     id="has_query_method"),
+        pytest.param(_IS_LEAF_DECL,
+                     "QuadTreeNode must declare isLeaf method",
+                     id="has_is_leaf_method"),
+    ])
+    def test_quadtree_node_declaration(self, collision_header, collision_header_normalized,
+                                       declaration, message):
+        """
+        Validates collision.h declares the QuadTreeNode struct with its
+        bounds, entities, children, depth and maxEntities members, its
+        (AABB&, depth = 0) constructor, and the insert, subdivide, clear,
+        query and isLeaf methods.
+        """
+        assert has_declaration(collision_header, collision_header_normalized, declaration), message
+
+
+_SPATIAL_PARTITION_MEMBER = 'QuadTreeNode*spatialPartition_;'
+_WORLD_BOUNDS_MEMBER = 'AABB worldBounds_;'
+_USE_SPATIAL_PARTITION_MEMBER = 'bool useSpatialPartition_;'
+_SET_SPATIAL_PARTITION_BOUNDS_DECL_RE = re.compile(
+    r'void\s+setSpatialPartitionBounds\s*\(\s*const\s+AABB\s*&\s+bounds\s*\)'
+)
+_ENABLE_SPATIAL_PARTITION_DECL = 'void enableSpatialPartition(bool enable)'
+_IS_SPATIAL_PARTITION_ENABLED_DECL = 'bool isSpatialPartitionEnabled()const'
+_REBUILD_SPATIAL_PARTITION_DECL = 'void rebuildSpatialPartition()'
 
-    def test_collision_world_has_rebuild_spatial_partition_method(self):
-        """
-        Checks CollisionWorld declares rebuildSpatialPartition method.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        assert re.search(r'void\s+rebuildSpatialPartition\s*\(\s*\)', content) is not None, \
-            "CollisionWorld must declare rebuildSpatialPartition method"
+
+class TestCollisionWorldSpatialPartition:
+
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_SPATIAL_PARTITION_MEMBER,
+                     "CollisionWorld must have spatialPartition_ member",
+                     id="has_spatial_partition_member"),
+        pytest.param(_WORLD_BOUNDS_MEMBER,
+                     "CollisionWorld must have worldBounds_ member",
+                     id="has_world_bounds_member"),
+        pytest.param(_USE_SPATIAL_PARTITION_MEMBER,
+                     "CollisionWorld must have useSpatialPartition_ member",
+                     id="has_use_spatial_partition_member"),
+        pytest.param(_SET_SPATIAL_PARTITION_BOUNDS_DECL_RE,
+                     "CollisionWorld must declare setSpatialPartitionBounds method",
+                     id="has_set_spatial_partition_bounds_method"),
+        pytest.param(_ENABLE_SPATIAL_PARTITION_DECL,
+                     "CollisionWorld must declare enableSpatialPartition method",
+                     id="has_enable_spatial_partition_method"),
+        pytest.param(_IS_SPATIAL_PARTITION_ENABLED_DECL,
+                     "CollisionWorld must declare isSpatialPartitionEnabled method",
+                     id="has_is_spatial_partition_enabled_method"),
+        pytest.param(_REBUILD_SPATIAL_PARTITION_DECL,
+                     "CollisionWorld must declare rebuildSpatialPartition method",
+                     id="has_rebuild_spatial_partition_method"),
+    ])
+    def test_collision_world_declaration(self, collision_world_header, collision_world_header_normalized,
+                                         declaration, message):
+        """
+        Validates CollisionWorld declares the spatialPartition_, worldBounds_
+        and useSpatialPartition_ members together with the methods that
+        configure, toggle, query and rebuild the spatial partition.
+        """
+        assert has_declaration(collision_world_header, collision_world_header_normalized, declaration), message
+
+
+_CONSTRUCTOR_INIT_LIST_RE = re.compile(
+    r'CollisionWorld::CollisionWorld\s*\(\s*\)\s*:([^{]+)\{'
+)
+_DESTRUCTOR_BODY_RE = re.compile(
+    r'CollisionWorld::~CollisionWorld\s*\(\s*\)[^{]*\{([^}]+)\}'
+)
+_SET_SPATIAL_PARTITION_BOUNDS_DEF = 'void CollisionWorld::setSpatialPartitionBounds'
+_ENABLE_SPATIAL_PARTITION_DEF = 'void CollisionWorld::enableSpatialPartition'
+_IS_SPATIAL_PARTITION_ENABLED_DEF = 'bool CollisionWorld::isSpatialPartitionEnabled'
+_REBUILD_SPATIAL_PARTITION_DEF = 'void CollisionWorld::rebuildSpatialPartition'
+
+
+@pytest.fixture(scope="module")
+def constructor_init_list(collision_world_source):
+    ctor_match = _CONSTRUCTOR_INIT_LIST_RE.search(collision_world_source)
+    return None if ctor_match is None else ctor_match.group(1)
 
 
 class TestCollisionWorldImplementations:
 
-    def test_constructor_initializes_spatial_partition_to_nullptr(self):
-        """
-        Validates CollisionWorld constructor initializes spatialPartition_ to nullptr.
+    @pytest.mark.parametrize("members,message", [
+        pytest.param(('spatialPartition_', 'nullptr'),
+                     "Constructor must initialize spatialPartition_ to nullptr",
+                     id="spatial_partition_to_nullptr"),
+        pytest.param(('useSpatialPartition_', 'false'),
+                     "Constructor must initialize useSpatialPartition_ to false",
+                     id="use_spatial_partition_to_false"),
+        pytest.param(('worldBounds_',),
+                     "Constructor must initialize worldBounds_",
+                     id="world_bounds"),
+    ])
+    def test_constructor_initializes(self, constructor_init_list, members, message):
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        ctor_match = re.search(
-            r'CollisionWorld::CollisionWorld\s*\(\s*\)\s*:([^{]+)\{',
-            content,
-            re.DOTALL
-        )
-        assert ctor_match is not None, "CollisionWorld constructor not found"
-        init_list = ctor_match.group(1)
-        assert 'spatialPartition_' in init_list and 'nullptr' in init_list, \
-            "Constructor must initialize spatialPartition_ to nullptr"
-
-    def test_constructor_initializes_use_spatial_partition_to_false(self):
+        Validates the CollisionWorld constructor initializer list sets
+        spatialPartition_ to nullptr, useSpatialPartition_ to false and
+        worldBounds_ to its default value.
         """
-        Validates CollisionWorld constructor initializes useSpatialPartition_ to false.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        ctor_match = re.search(
-            r'CollisionWorld::CollisionWorld\s*\(\s*\)\s*:([^{]+)\{',
-            content,
-            re.DOTALL
-        )
-        assert ctor_match is not None, "CollisionWorld constructor not found"
-        init_list = ctor_match.group(1)
-        assert 'useSpatialPartition_' in init_list and 'false' in init_list, \
-            "Constructor must initialize useSpatialPartition_ to false"
-
-    def test_constructor_initializes_world_bounds(self):
-        """
-        Validates CollisionWorld constructor initializes worldBounds_ with default values.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        ctor_match = re.search(
-            r'CollisionWorld::CollisionWorld\s*\(\s*\)\s*:([^{]+)\{',
-            content,
-            re.DOTALL
-        )
-        assert ctor_match is not None, "CollisionWorld constructor not found"
-        init_list = ctor_match.group(1)
-        assert 'worldBounds_' in init_list, \
-            "Constructor must initialize worldBounds_"
-
-    def test_destructor_deletes_spatial_partition(self):
+        assert constructor_init_list is not None, "CollisionWorld constructor not found"
+        assert all(member in constructor_init_list for member in members), message
+
+    def test_destructor_deletes_spatial_partition(self, collision_world_source):
         """
         Validates CollisionWorld destructor deletes spatialPartition_.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        dtor_match = re.search(
-            r'CollisionWorld::~CollisionWorld\s*\(\s*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
+        dtor_match = _DESTRUCTOR_BODY_RE.search(collision_world_source)
         assert dtor_match is not None, "CollisionWorld destructor not found"
         dtor_body = dtor_match.group(1)
         assert 'delete' in dtor_body and 'spatialPartition_' in dtor_body, \
             "Destructor must delete spatialPartition_"
 
-    def test_set_spatial_partition_bounds_implementation_exists(self):
-        """
-        Checks setSpatialPartitionBounds implementation exists.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        assert re.search(r'void\s+CollisionWorld::setSpatialPartitionBounds', content) is not None, \
-            "setSpatialPartitionBounds implementation must exist"
-
-    def test_enable_spatial_partition_implementation_exists(self):
-        """
-        Checks enableSpatialPartition implementation exists.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        assert re.search(r'void\s+CollisionWorld::enableSpatialPartition', content) is not None, \
-            "enableSpatialPartition implementation must exist"
-
-    def test_is_spatial_partition_enabled_implementation_exists(self):
-        """
-        Checks isSpatialPartitionEnabled implementation exists.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        assert re.search(r'bool\s+CollisionWorld::isSpatialPartitionEnabled', content) is not None, \
-            "isSpatialPartitionEnabled implementation must exist"
-
-    def test_rebuild_spatial_partition_implementation_exists(self):
-        """
-        Checks rebuildSpatialPartition implementation exists.
-        """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        assert re.search(r'void\s+CollisionWorld::rebuildSpatialPartition', content) is not None, \
-            "rebuildSpatialPartition implementation must exist"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_SET_SPATIAL_PARTITION_BOUNDS_DEF,
+                     "setSpatialPartitionBounds implementation must exist",
+                     id="set_spatial_partition_bounds"),
+        pytest.param(_ENABLE_SPATIAL_PARTITION_DEF,
+                     "enableSpatialPartition implementation must exist",
+                     id="enable_spatial_partition"),
+        pytest.param(_IS_SPATIAL_PARTITION_ENABLED_DEF,
+                     "isSpatialPartitionEnabled implementation must exist",
+                     id="is_spatial_partition_enabled"),
+        pytest.param(_REBUILD_SPATIAL_PARTITION_DEF,
+                     "rebuildSpatialPartition implementation must exist",
+                     id="rebuild_spatial_partition"),
+    ])
+    def test_implementation_exists(self, collision_world_source, collision_world_source_normalized,
+                                   declaration, message):
+        """
+        Checks collision_world.cpp defines each spatial partition method.
+        """
+        assert has_declaration(collision_world_source, collision_world_source_normalized, declaration), message
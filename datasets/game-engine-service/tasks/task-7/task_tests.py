@@ -1,316 +1,294 @@
 import re
+from functools import lru_cache
+from pathlib import Path
+
 import pytest
 
 
+@lru_cache(maxsize=None)
 def read_file_content(filepath: str) -> str:
-    with open(filepath, 'r') as f:
-        return f.read()
+    """Read and return the contents of a source file, once per test session."""
+    return Path(filepath).read_bytes().decode()
 
 
-class TestSpriteBatchDeclarations:
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACING_RE = re.compile(r' ?([^\w ]) ?')
 
-    def test_sprite_batch_struct_declared(self):
-        """
-        Checks that SpriteBatch struct is declared in sprite.h.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'struct\s+SpriteBatch\s*\{', content) is not None, \
-            "SpriteBatch struct must be declared"
 
-    def test_sprite_batch_has_default_constructor(self):
-        """
-        Checks SpriteBatch declares default constructor.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'SpriteBatch\s*\(\s*\)\s*;', content) is not None, \
-            "SpriteBatch must declare default constructor"
+def normalize_whitespace(source: str) -> str:
+    """
+    Return source with whitespace runs collapsed to a single space and
+    dropped around punctuation, so that declarations can be matched as
+    plain substrings. This is looser than a whitespace-tolerant regex:
+    spacing the regex would reject, such as 'std:: string' or '} ;', is
+    accepted too.
+    """
+    return _PUNCTUATION_SPACING_RE.sub(r'\1', _WHITESPACE_RE.sub(' ', source))
 
-    def test_sprite_batch_has_texture_id_constructor(self):
-        """
-        Checks SpriteBatch declares constructor taking texture ID.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'explicit\s+SpriteBatch\s*\(\s*const\s+std::string\s*&', content) is not None, \
-            "SpriteBatch must declare explicit constructor with const std::string&"
 
-    def test_sprite_batch_has_texture_id_member(self):
-        """
-        Validates SpriteBatch has textureId string member.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'std::string\s+textureId\s*;', content) is not None, \
-            "SpriteBatch must have textureId member"
+def has_declaration(source: str, normalized: str, declaration) -> bool:
+    """
+    Return whether source contains declaration, given either as a fixed
+    string looked up in the whitespace-normalized source or as a compiled
+    pattern searched in the raw source.
+    """
+    if isinstance(declaration, str):
+        return declaration in normalized
+    return declaration.search(source) is not None
 
-    def test_sprite_batch_has_sprites_vector_member(self):
-        """
-        Validates SpriteBatch has sprites vector member.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'std::vector<Sprite>\s+sprites\s*;', content) is not None, \
-            "SpriteBatch must have sprites vector member"
 
-    def test_sprite_batch_has_max_batch_size_member(self):
-        """
-        Validates SpriteBatch has maxBatchSize size_t member.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'size_t\s+maxBatchSize\s*;', content) is not None, \
-            "SpriteBatch must have maxBatchSize member"
-
-    def test_sprite_batch_has_auto_flush_member(self):
-        """
-        Validates SpriteBatch has autoFlush bool member.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'bool\s+autoFlush\s*;', content) is not None, \
-            "SpriteBatch must have autoFlush member"
+@pytest.fixture(scope="session")
+def sprite_header() -> str:
+    return read_file_content('project/include/rendering/sprite.h')
 
-    def test_sprite_batch_has_add_method(self):
-        """
-        Checks SpriteBatch declares add method taking const Sprite reference.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'void\s+add\s*\(\s*const\s+Sprite\s*&', content) is not None, \
-            "SpriteBatch must declare add(const Sprite&) method"
 
-    def test_sprite_batch_has_flush_method(self):
-        """
-        Checks SpriteBatch declares flush method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'void\s+flush\s*\(\s*\)', content) is not None, \
-            "SpriteBatch must declare flush() method"
+@pytest.fixture(scope="session")
+def animation_header() -> str:
+    return read_file_content('project/include/rendering/animation.h')
 
-    def test_sprite_batch_has_clear_method(self):
-        """
-        Checks SpriteBatch declares clear method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'void\s+clear\s*\(\s*\)', content) is not None, \
-            "SpriteBatch must declare clear() method"
 
-    def test_sprite_batch_has_get_count_method(self):
-        """
-        Checks SpriteBatch declares getCount method returning size_t.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'size_t\s+getCount\s*\(\s*\)\s*const', content) is not None, \
-            "SpriteBatch must declare getCount() const method"
+@pytest.fixture(scope="session")
+def animation_source() -> str:
+    return read_file_content('project/src/rendering/animation.cpp')
 
-    def test_sprite_batch_has_get_texture_id_method(self):
-        """
-        Checks SpriteBatch declares getTextureId method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'const\s+std::string\s*&\s+getTextureId\s*\(\s*\)\s*const', content) is not None, \
-            "SpriteBatch must declare getTextureId() const method"
 
-    def test_sprite_batch_has_is_empty_method(self):
-        """
-        Checks SpriteBatch declares isEmpty method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'bool\s+isEmpty\s*\(\s*\)\s*const', content) is not None, \
-            "SpriteBatch must declare isEmpty() const method"
+@pytest.fixture(scope="session")
+def sprite_header_normalized(sprite_header) -> str:
+    return normalize_whitespace(sprite_header)
 
-    def test_sprite_batch_has_is_full_method(self):
-        """
-        Checks SpriteBatch declares isFull method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'bool\s+isFull\s*\(\s*\)\s*const', content) is not None, \
-            "SpriteBatch must declare isFull() const method"
 
+@pytest.fixture(scope="session")
+def animation_header_normalized(animation_header) -> str:
+    return normalize_whitespace(animation_header)
 
-class TestBatchRendererDeclarations:
 
-    def test_batch_renderer_class_declared(self):
-        """
-        Validates BatchRenderer class is declared in sprite.h.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'class\s+BatchRenderer\s*\{', content) is not None, \
-            "BatchRenderer class must be declared"
+@pytest.fixture(scope="session")
+def animation_source_normalized(animation_source) -> str:
+    return normalize_whitespace(animation_source)
 
-    def test_batch_renderer_has_batch_size_constructor(self):
-        """
-        Checks BatchRenderer declares constructor taking batch size.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'explicit\s+BatchRenderer\s*\(\s*size_t', content) is not None, \
-            "BatchRenderer must declare explicit constructor with size_t parameter"
 
-    def test_batch_renderer_has_batches_member(self):
-        """
-        Checks BatchRenderer has batches_ vector member.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'std::vector<SpriteBatch>\s+batches_\s*;', content) is not None, \
-            "BatchRenderer must have batches_ vector member"
+_SPRITE_BATCH_STRUCT = 'struct SpriteBatch{'
+_SPRITE_BATCH_DEFAULT_CONSTRUCTOR = 'SpriteBatch();'
+_SPRITE_BATCH_TEXTURE_ID_CONSTRUCTOR = 'explicit SpriteBatch(const std::string&'
+_TEXTURE_ID_MEMBER = 'std::string textureId;'
+_SPRITES_MEMBER_RE = re.compile(r'std::vector<Sprite>\s+sprites\s*;')
+_MAX_BATCH_SIZE_MEMBER = 'size_t maxBatchSize;'
+_AUTO_FLUSH_MEMBER = 'bool autoFlush;'
+_ADD_DECL = 'void add(const Sprite&'
+_FLUSH_DECL = 'void flush()'
+_CLEAR_DECL = 'void clear()'
+_GET_COUNT_DECL = 'size_t getCount()const'
+_GET_TEXTURE_ID_DECL_RE = re.compile(r'const\s+std::string\s*&\s+getTextureId\s*\(\s*\)\s*const')
+_IS_EMPTY_DECL = 'bool isEmpty()const'
+_IS_FULL_DECL = 'bool isFull()const'
 
-    def test_batch_renderer_has_batch_indices_member(self):
-        """
-        Checks BatchRenderer has batchIndices_ map member.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'std::unordered_map<std::string,\s*size_t>\s+batchIndices_\s*;', content) is not None, \
-            "BatchRenderer must have batchIndices_ map member"
 
-    def test_batch_renderer_has_default_batch_size_member(self):
-        """
-        Checks BatchRenderer has defaultBatchSize_ size_t member.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'size_t\s+defaultBatchSize_\s*;', content) is not None, \
-            "BatchRenderer must have defaultBatchSize_ member"
-
-    def test_batch_renderer_has_submit_method(self):
-        """
-        Validates BatchRenderer declares submit method taking const Sprite reference.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'void\s+submit\s*\(\s*const\s+Sprite\s*&', content) is not None, \
-            "BatchRenderer must declare submit(const Sprite&) method"
-
-    def test_batch_renderer_has_flush_method(self):
-        """
-        Validates BatchRenderer declares flush method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'void\s+flush\s*\(\s*\)', content) is not None, \
-            "BatchRenderer must declare flush() method"
+class TestSpriteBatchDeclarations:
 
-    def test_batch_renderer_has_flush_batch_method(self):
-        """
-        Validates BatchRenderer declares flushBatch method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'void\s+flushBatch\s*\(\s*const\s+std::string\s*&', content) is not None, \
-            "BatchRenderer must declare flushBatch(const std::string&) method"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_SPRITE_BATCH_STRUCT,
+                     "SpriteBatch struct must be declared",
+                     id="struct_declared"),
+        pytest.param(_SPRITE_BATCH_DEFAULT_CONSTRUCTOR,
+                     "SpriteBatch must declare default constructor",
+                     id="has_default_constructor"),
+        pytest.param(_SPRITE_BATCH_TEXTURE_ID_CONSTRUCTOR,
+                     "SpriteBatch must declare explicit constructor with const std::string&",
+                     id="has_texture_id_constructor"),
+        pytest.param(_TEXTURE_ID_MEMBER,
+                     "SpriteBatch must have textureId member",
+                     id="has_texture_id_member"),
+        pytest.param(_SPRITES_MEMBER_RE,
+                     "SpriteBatch must have sprites vector member",
+                     id="has_sprites_vector_member"),
+        pytest.param(_MAX_BATCH_SIZE_MEMBER,
+                     "SpriteBatch must have maxBatchSize member",
+                     id="has_max_batch_size_member"),
+        pytest.param(_AUTO_FLUSH_MEMBER,
+                     "SpriteBatch must have autoFlush member",
+                     id="has_auto_flush_member"),
+        pytest.param(_ADD_DECL,
+                     "SpriteBatch must declare add(const Sprite&) method",
+                     id="has_add_method"),
+        pytest.param(_FLUSH_DECL,
+                     "SpriteBatch must declare flush() method",
+                     id="has_flush_method"),
+        pytest.param(_CLEAR_DECL,
+                     "SpriteBatch must declare clear() method",
+                     id="has_clear_method"),
+        pytest.param(_GET_COUNT_DECL,
+                     "SpriteBatch must declare getCount() const method",
+                     id="has_get_count_method"),
+        pytest.param(_GET_TEXTURE_ID_DECL_RE,
+                     "SpriteBatch must declare getTextureId() const method",
+                     id="has_get_texture_id_method"),
+        pytest.param(_IS_EMPTY_DECL,
+                     "SpriteBatch must declare isEmpty() const method",
+                     id="has_is_empty_method"),
+        pytest.param(_IS_FULL_DECL,
+                     "SpriteBatch must declare isFull() const method",
+                     id="has_is_full_method"),
+    ])
+    def test_sprite_batch_declaration(self, sprite_header, sprite_header_normalized,
+                                      declaration, message):
+        """
+        Checks sprite.h declares the SpriteBatch struct with its constructors,
+        textureId, sprites, maxBatchSize and autoFlush members, and the add,
+        flush, clear, getCount, getTextureId, isEmpty and isFull methods.
+        """
+        assert has_declaration(sprite_header, sprite_header_normalized, declaration), message
+
+
+_BATCH_RENDERER_CLASS = 'class BatchRenderer{'
+_BATCH_RENDERER_CONSTRUCTOR = 'explicit BatchRenderer(size_t'
+_BATCHES_MEMBER_RE = re.compile(r'std::vector<SpriteBatch>\s+batches_\s*;')
+_BATCH_INDICES_MEMBER_RE = re.compile(
+    r'std::unordered_map<std::string,\s*size_t>\s+batchIndices_\s*;'
+)
+_DEFAULT_BATCH_SIZE_MEMBER = 'size_t defaultBatchSize_;'
+_SUBMIT_DECL = 'void submit(const Sprite&'
+_FLUSH_BATCH_DECL = 'void flushBatch(const std::string&'
+_GET_BATCH_COUNT_DECL = 'size_t getBatchCount()'
+_GET_TOTAL_SPRITE_COUNT_DECL = 'size_t getTotalSpriteCount()'
+_SET_DEFAULT_BATCH_SIZE_DECL = 'void setDefaultBatchSize(size_t'
+_GET_DEFAULT_BATCH_SIZE_DECL = 'size_t getDefaultBatchSize()'
 
-    def test_batch_renderer_has_get_batch_count_method(self):
-        """
-        Validates BatchRenderer declares getBatchCount method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'size_t\s+getBatchCount\s*\(\s*\)', content) is not None, \
-            "BatchRenderer must declare getBatchCount() method"
 
-    def test_batch_renderer_has_get_total_sprite_count_method(self):
-        """
-        Validates BatchRenderer declares getTotalSpriteCount method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'size_t\s+getTotalSpriteCount\s*\(\s*\)', content) is not None, \
-            "BatchRenderer must declare getTotalSpriteCount() method"
-
-    def test_batch_renderer_has_set_default_batch_size_method(self):
-        """
-        Validates BatchRenderer declares setDefaultBatchSize method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'void\s+setDefaultBatchSize\s*\(\s*size_t', content) is not None, \
-            "BatchRenderer must declare setDefaultBatchSize(size_t) method"
+class TestBatchRendererDeclarations:
 
-    def test_batch_renderer_has_get_default_batch_size_method(self):
-        """
-        Validates BatchRenderer declares getDefaultBatchSize method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'size_t\s+getDefaultBatchSize\s*\(\s*\)', content) is not None, \
-            "BatchRenderer must declare getDefaultBatchSize() method"
-
-    def test_batch_renderer_has_clear_method(self):
-        """
-        Validates BatchRenderer declares clear method.
-        """
-        content = read_file_content('project/include/rendering/sprite.h')
-        assert re.search(r'void\s+clear\s*\(\s*\)', content) is not None, \
-            "BatchRenderer must declare clear() method"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_BATCH_RENDERER_CLASS,
+                     "BatchRenderer class must be declared",
+                     id="class_declared"),
+        pytest.param(_BATCH_RENDERER_CONSTRUCTOR,
+                     "BatchRenderer must declare explicit constructor with size_t parameter",
+                     id="has_batch_size_constructor"),
+        pytest.param(_BATCHES_MEMBER_RE,
+                     "BatchRenderer must have batches_ vector member",
+                     id="has_batches_member"),
+        pytest.param(_BATCH_INDICES_MEMBER_RE,
+                     "BatchRenderer must have batchIndices_ map member",
+                     id="has_batch_indices_member"),
+        pytest.param(_DEFAULT_BATCH_SIZE_MEMBER,
+                     "BatchRenderer must have defaultBatchSize_ member",
+                     id="has_default_batch_size_member"),
+        pytest.param(_SUBMIT_DECL,
+                     "BatchRenderer must declare submit(const Sprite&) method",
+                     id="has_submit_method"),
+        pytest.param(_FLUSH_DECL,
+                     "BatchRenderer must declare flush() method",
+                     id="has_flush_method"),
+        pytest.param(_FLUSH_BATCH_DECL,
+                     "BatchRenderer must declare flushBatch(const std::string&) method",
+                     id="has_flush_batch_method"),
+        pytest.param(_GET_BATCH_COUNT_DECL,
+                     "BatchRenderer must declare getBatchCount() method",
+                     id="has_get_batch_count_method"),
+        pytest.param(_GET_TOTAL_SPRITE_COUNT_DECL,
+                     "BatchRenderer must declare getTotalSpriteCount() method",
+                     id="has_get_total_sprite_count_method"),
+        pytest.param(_SET_DEFAULT_BATCH_SIZE_DECL,
+                     "BatchRenderer must declare setDefaultBatchSize(size_t) method",
+                     id="has_set_default_batch_size_method"),
+        pytest.param(_GET_DEFAULT_BATCH_SIZE_DECL,
+                     "BatchRenderer must declare getDefaultBatchSize() method",
+                     id="has_get_default_batch_size_method"),
+        pytest.param(_CLEAR_DECL,
+                     "BatchRenderer must declare clear() method",
+                     id="has_clear_method"),
+    ])
+    def test_batch_renderer_declaration(self, sprite_header, sprite_header_normalized,
+                                        declaration, message):
+        """
+        Validates sprite.h declares the BatchRenderer class with its batch
+        size constructor, batches_, batchIndices_ and defaultBatchSize_
+        members, and its submit, flush, batch-count and batch-size methods.
+        """
+        assert has_declaration(sprite_header, sprite_header_normalized, declaration), message
+
+
+_BATCH_ID_MEMBER = 'int batchId;'
 
 
 class TestAnimationFrameBatchId:
 
-    def test_animation_frame_has_batch_id_member(self):
+    def test_animation_frame_has_batch_id_member(self, animation_header_normalized):
         """
         Validates AnimationFrame struct has batchId int member.
         """
-        content = read_file_content('project/include/rendering/animation.h')
-        assert re.search(r'int\s+batchId\s*;', content) is not None, \
+        assert _BATCH_ID_MEMBER in animation_header_normalized, \
             "AnimationFrame must have batchId int member"
 
 
-class TestAnimationTextureAtlas:
+_TEXTURE_ATLAS_ID_MEMBER = 'std::string textureAtlasId_;'
+_SET_TEXTURE_ATLAS_ID_DECL = 'void setTextureAtlasId(const std::string&'
+_GET_TEXTURE_ATLAS_ID_DECL_RE = re.compile(r'const\s+std::string\s*&\s+getTextureAtlasId\s*\(\s*\)')
 
-    def test_animation_has_texture_atlas_id_member(self):
-        """
-        Validates Animation class has textureAtlasId_ string member.
-        """
-        content = read_file_content('project/include/rendering/animation.h')
-        assert re.search(r'std::string\s+textureAtlasId_\s*;', content) is not None, \
-            "Animation must have textureAtlasId_ member"
 
-    def test_animation_has_set_texture_atlas_id_method(self):
-        """
-        Checks Animation declares setTextureAtlasId method.
-        """
-        content = read_file_content('project/include/rendering/animation.h')
-        assert re.search(r'void\s+setTextureAtlasId\s*\(\s*const\s+std::string\s*&', content) is not None, \
-            "Animation must declare setTextureAtlasId method"
+class TestAnimationTextureAtlas:
 
-    def test_animation_has_get_texture_atlas_id_method(self):
-        """
-        Checks Animation declares getTextureAtlasId method.
-        """
-        content = read_file_content('project/include/rendering/animation.h')
-        assert re.search(r'const\s+std::string\s*&\s+getTextureAtlasId\s*\(\s*\)', content) is not None, \
-            "Animation must declare getTextureAtlasId method"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_TEXTURE_ATLAS_ID_MEMBER,
+                     "Animation must have textureAtlasId_ member",
+                     id="has_texture_atlas_id_member"),
+        pytest.param(_SET_TEXTURE_ATLAS_ID_DECL,
+                     "Animation must declare setTextureAtlasId method",
+                     id="has_set_texture_atlas_id_method"),
+        pytest.param(_GET_TEXTURE_ATLAS_ID_DECL_RE,
+                     "Animation must declare getTextureAtlasId method",
+                     id="has_get_texture_atlas_id_method"),
+    ])
+    def test_animation_declaration(self, animation_header, animation_header_normalized,
+                                   declaration, message):
+        """
+        Validates Animation declares the textureAtlasId_ string member and
+        its setTextureAtlasId/getTextureAtlasId accessors.
+        """
+        assert has_declaration(animation_header, animation_header_normalized, declaration), message
+
+
+_DEFAULT_CONSTRUCTOR_INIT_LIST_RE = re.compile(
+    r'Animation::Animation\s*\(\s*\)\s*:([^{]+)\{',
+    re.DOTALL
+)
+_NAME_CONSTRUCTOR_INIT_LIST_RE = re.compile(
+    r'Animation::Animation\s*\(\s*const\s+std::string\s*&[^)]*\)\s*:([^{]+)\{',
+    re.DOTALL
+)
+_SET_TEXTURE_ATLAS_ID_DEF = 'void Animation::setTextureAtlasId'
+_GET_TEXTURE_ATLAS_ID_DEF_RE = re.compile(r'const\s+std::string\s*&\s+Animation::getTextureAtlasId')
 
 
 class TestAnimationImplementations:
 
-    def test_animation_default_constructor_initializes_texture_atlas_id(self):
-        """
-        Validates Animation default constructor initializes textureAtlasId_ in initializer list.
-        """
-        content = read_file_content('project/src/rendering/animation.cpp')
-        ctor_match = re.search(
-            r'Animation::Animation\s*\(\s*\)\s*:([^{]+)\{',
-            content,
-            re.DOTALL
-        )
-        assert ctor_match is not None, "Default constructor not found"
-        init_list = ctor_match.group(1)
-        assert 'textureAtlasId_' in init_list, \
-            "Default constructor must initialize textureAtlasId_ in initializer list"
-
-    def test_animation_name_constructor_initializes_texture_atlas_id(self):
+    @pytest.mark.parametrize("pattern,constructor", [
+        pytest.param(_DEFAULT_CONSTRUCTOR_INIT_LIST_RE, "Default constructor",
+                     id="default_constructor"),
+        pytest.param(_NAME_CONSTRUCTOR_INIT_LIST_RE, "Constructor with name parameter",
+                     id="name_constructor"),
+    ])
+    def test_constructor_initializes_texture_atlas_id(self, animation_source, pattern, constructor):
         """
-        Validates Animation(name) constructor initializes textureAtlasId_ in initializer list.
+        Validates both the default and the Animation(name) constructors
+        initialize textureAtlasId_ in their initializer lists.
         """
-        content = read_file_content('project/src/rendering/animation.cpp')
-        ctor_match = re.search(
-            r'Animation::Animation\s*\(\s*const\s+std::string\s*&[^)]*\)\s*:([^{]+)\{',
-            content,
-            re.DOTALL
-        )
-        assert ctor_match is not None, "Constructor with name parameter not found"
+        ctor_match = pattern.search(animation_source)
+        assert ctor_match is not None, f"{constructor} not found"
         init_list = ctor_match.group(1)
         assert 'textureAtlasId_' in init_list, \
-            "Constructor must initialize textureAtlasId_ in initializer list"
-
-    def test_set_texture_atlas_id_implementation_exists(self):
-        """
-        Checks setTextureAtlasId implementation exists in animation.cpp.
-        """
-        content = read_file_content('project/src/rendering/animation.cpp')
-        assert re.search(r'void\s+Animation::setTextureAtlasId', content) is not None, \
-            "setTextureAtlasId implementation must exist"
-
-    def test_get_texture_atlas_id_implementation_exists(self):
-        """
-        Checks getTextureAtlasId implementation exists in animation.cpp.
-        """
-        content = read_file_content('project/src/rendering/animation.cpp')
-        assert re.search(r'const\s+std::string\s*&\s+Animation::getTextureAtlasId', content) is not None, \
-            "getTextureAtlasId implementation must exist"
+            f"{constructor} must initialize textureAtlasId_ in initializer list"
+
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_SET_TEXTURE_ATLAS_ID_DEF,
+                     "setTextureAtlasId implementation must exist",
+                     id="set_texture_atlas_id"),
+        pytest.param(_GET_TEXTURE_ATLAS_ID_DEF_RE,
+                     "getTextureAtlasId implementation must exist",
+                     id="get_texture_atlas_id"),
+    ])
+    def test_implementation_exists(self, animation_source, animation_source_normalized,
+                                   declaration, message):
+        """
+        Checks the texture atlas accessors are implemented in animation.cpp.
+        """
+        assert has_declaration(animation_source, animation_source_normalized, declaration), message
@@ -1,227 +1,280 @@
 import re
+from functools import lru_cache
+from pathlib import Path
+
 import pytest
 
 
+@lru_cache(maxsize=None)
 def read_file_content(filepath: str) -> str:
-    with open(filepath, 'r') as f:
-        return f.read()
+    """Read and return the contents of a source file, once per test session."""
+    return Path(filepath).read_bytes().decode()
 
 
-class TestTimeManagerInterpolationDeclarations:
-    """Tests for interpolation declarations in TimeManager header."""
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACING_RE = re.compile(r' ?([^\w ]) ?')
 
-    def test_interpolation_alpha_member_declared(self):
-        """
-        Validates that TimeManager declares an interpolationAlpha_ member
-        as a double to store the current interpolation factor.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_member = re.search(r'double\s+interpolationAlpha_\s*;', content)
-        assert has_member is not None, \
-            "TimeManager must have interpolationAlpha_ as double member"
 
-    def test_set_interpolation_alpha_declared(self):
-        """
-        Verifies that TimeManager declares a setInterpolationAlpha method
-        taking a double parameter.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_method = re.search(r'void\s+setInterpolationAlpha\s*\(\s*double', content)
-        assert has_method is not None, \
-            "TimeManager must declare setInterpolationAlpha(double) method"
+def normalize_whitespace(source: str) -> str:
+    """
+    Return source with whitespace runs collapsed to a single space and
+    dropped around punctuation, so that declarations can be matched as
+    plain substrings. This is looser than a whitespace-tolerant regex:
+    spacing the regex would reject, such as 'std:: string' or '} ;', is
+    accepted too.
+    """
+    return _PUNCTUATION_SPACING_RE.sub(r'\1', _WHITESPACE_RE.sub(' ', source))
 
-    def test_get_interpolation_alpha_declared(self):
-        """
-        Confirms that TimeManager declares a getInterpolationAlpha method
-        returning a double.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_method = re.search(r'double\s+getInterpolationAlpha\s*\(\s*\)', content)
-        assert has_method is not None, \
-            "TimeManager must declare getInterpolationAlpha() method"
 
-    def test_calculate_interpolation_alpha_declared(self):
-        """
-        Validates that TimeManager declares a calculateInterpolationAlpha method
-        taking accumulator and fixedDt parameters.
-        """
-        content = read_file_content('project/include/core/time_manager.h')
-        
-        has_method = re.search(
-            r'double\s+calculateInterpolationAlpha\s*\([^)]*double[^)]*double',
-            content
-        )
-        assert has_method is not None, \
-            "TimeManager must declare calculateInterpolationAlpha(double, double) method"
+def has_declaration(source: str, normalized: str, declaration) -> bool:
+    """
+    Return whether source contains declaration, given either as a fixed
+    string looked up in the whitespace-normalized source or as a compiled
+    pattern searched in the raw source.
+    """
+    if isinstance(declaration, str):
+        return declaration in normalized
+    return declaration.search(source) is not None
+
+
+_BRACE_RE = re.compile(r'[{}]')
+
+
+def find_closing_brace(source: str, start: int) -> int:
+    """
+    Return the index of the '}' that closes a block whose body starts at
+    start, or len(source) if the block is never closed.
+    """
+    depth = 1
+    for brace in _BRACE_RE.finditer(source, start):
+        depth += 1 if brace.group() == '{' else -1
+        if depth == 0:
+            return brace.start()
+    return len(source)
+
+
+def extract_body(source: str, signature: re.Pattern):
+    """
+    Return the block opened by the first match of signature (which must end
+    at the opening '{'), or None if signature does not match.
+    """
+    match = signature.search(source)
+    if match is None:
+        return None
+    return source[match.end():find_closing_brace(source, match.end())]
+
+
+@pytest.fixture(scope="session")
+def time_manager_header() -> str:
+    return read_file_content('project/include/core/time_manager.h')
+
+
+@pytest.fixture(scope="session")
+def time_manager_source() -> str:
+    return read_file_content('project/src/core/time_manager.cpp')
+
+
+@pytest.fixture(scope="session")
+def collision_header() -> str:
+    return read_file_content('project/include/physics/collision.h')
+
+
+@pytest.fixture(scope="session")
+def collision_source() -> str:
+    return read_file_content('project/src/physics/collision.cpp')
+
+
+@pytest.fixture(scope="session")
+def collision_world_header() -> str:
+    return read_file_content('project/include/physics/collision_world.h')
+
+
+@pytest.fixture(scope="session")
+def collision_world_source() -> str:
+    return read_file_content('project/src/physics/collision_world.cpp')
+
+
+@pytest.fixture(scope="session")
+def time_manager_header_normalized(time_manager_header) -> str:
+    return normalize_whitespace(time_manager_header)
+
+
+@pytest.fixture(scope="session")
+def time_manager_source_normalized(time_manager_source) -> str:
+    return normalize_whitespace(time_manager_source)
+
+
+@pytest.fixture(scope="session")
+def collision_header_normalized(collision_header) -> str:
+    return normalize_whitespace(collision_header)
+
+
+@pytest.fixture(scope="session")
+def collision_world_header_normalized(collision_world_header) -> str:
+    return normalize_whitespace(collision_world_header)
+
+
+@pytest.fixture(scope="session")
+def collision_world_source_normalized(collision_world_source) -> str:
+    return normalize_whitespace(collision_world_source)
+
+
+_INTERPOLATION_ALPHA_MEMBER = 'double interpolationAlpha_;'
+_SET_INTERPOLATION_ALPHA_DECL = 'void setInterpolationAlpha(double'
+_GET_INTERPOLATION_ALPHA_DECL = 'double getInterpolationAlpha()'
+_CALCULATE_INTERPOLATION_ALPHA_DECL_RE = re.compile(
+    r'double\s+calculateInterpolationAlpha\s*\([^)]*double[^)]*double'
+)
+
+
+class TestTimeManagerInterpolationDeclarations:
+    """Tests for interpolation declarations in TimeManager header."""
+
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_INTERPOLATION_ALPHA_MEMBER,
+                     "TimeManager must have interpolationAlpha_ as double member",
+                     id="interpolation_alpha_member"),
+        pytest.param(_SET_INTERPOLATION_ALPHA_DECL,
+                     "TimeManager must declare setInterpolationAlpha(double) method",
+                     id="set_interpolation_alpha"),
+        pytest.param(_GET_INTERPOLATION_ALPHA_DECL,
+                     "TimeManager must declare getInterpolationAlpha() method",
+                     id="get_interpolation_alpha"),
+        pytest.param(_CALCULATE_INTERPOLATION_ALPHA_DECL_RE,
+                     "TimeManager must declare calculateInterpolationAlpha(double, double) method",
+                     id="calculate_interpolation_alpha"),
+    ])
+    def test_time_manager_declaration(self, time_manager_header, time_manager_header_normalized,
+                                      declaration, message):
+        """
+        Checks time_manager.h declares the interpolationAlpha_ double member
+        and the setInterpolationAlpha, getInterpolationAlpha and
+        calculateInterpolationAlpha methods.
+        """
+        assert has_declaration(time_manager_header, time_manager_header_normalized, declaration), message
+
+
+_INTERPOLATION_ALPHA_INIT = 'interpolationAlpha_(0.0)'
+_RESET_BODY_RE = re.compile(r'void\s+TimeManager::reset\s*\([^)]*\)[^{;]*\{')
+_SET_INTERPOLATION_ALPHA_BODY_RE = re.compile(
+    r'void\s+TimeManager::setInterpolationAlpha\s*\([^)]*\)[^{;]*\{'
+)
+_CALCULATE_INTERPOLATION_ALPHA_BODY_RE = re.compile(
+    r'double\s+TimeManager::calculateInterpolationAlpha\s*\([^)]*\)[^{;]*\{'
+)
 
 
 class TestTimeManagerInterpolationImplementations:
     """Tests for interpolation implementations in TimeManager source."""
 
-    def test_constructor_initializes_interpolation_alpha(self):
+    def test_constructor_initializes_interpolation_alpha(self, time_manager_source_normalized):
         """
         Ensures the TimeManager constructor initializes interpolationAlpha_
         to 0.0 in the initializer list.
         """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        has_init = re.search(r'interpolationAlpha_\s*\(\s*0\.0\s*\)', content)
-        assert has_init is not None, \
+        has_init = _INTERPOLATION_ALPHA_INIT in time_manager_source_normalized
+        assert has_init, \
             "Constructor must initialize interpolationAlpha_ to 0.0"
 
-    def test_reset_clears_interpolation_alpha(self):
+    def test_reset_clears_interpolation_alpha(self, time_manager_source):
         """
         Verifies that the reset method sets interpolationAlpha_ to 0.0.
         """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        reset_match = re.search(
-            r'void\s+TimeManager::reset\s*\([^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert reset_match is not None, "reset method not found"
+        reset_body = extract_body(time_manager_source, _RESET_BODY_RE)
+        assert reset_body is not None, "reset method not found"
         
-        reset_body = reset_match.group(1)
         has_reset = 'interpolationAlpha_' in reset_body and '0.0' in reset_body
         assert has_reset, \
             "reset must set interpolationAlpha_ to 0.0"
 
-    def test_set_interpolation_alpha_clamps_value(self):
+    def test_set_interpolation_alpha_clamps_value(self, time_manager_source):
         """
         Confirms that setInterpolationAlpha clamps values between 0.0 and 1.0
         using std::max and std::min.
         """
-        content = read_file_content('project/src/core/time_manager.cpp')
+        method_body = extract_body(time_manager_source, _SET_INTERPOLATION_ALPHA_BODY_RE)
+        assert method_body is not None, "setInterpolationAlpha method not found"
         
-        method_match = re.search(
-            r'void\s+TimeManager::setInterpolationAlpha\s*\([^)]*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert method_match is not None, "setInterpolationAlpha method not found"
-        
-        method_body = method_match.group(1)
         has_clamp = 'max' in method_body and 'min' in method_body
         assert has_clamp, \
             "setInterpolationAlpha must clamp value using max and min"
 
-    def test_calculate_interpolation_alpha_handles_zero_fixed_dt(self):
+    def test_calculate_interpolation_alpha_handles_zero_fixed_dt(self, time_manager_source):
         """
         Validates that calculateInterpolationAlpha returns 0.0 when
         fixedDt is zero or negative to avoid division by zero.
         """
-        content = read_file_content('project/src/core/time_manager.cpp')
-        
-        method_match = re.search(
-            r'double\s+TimeManager::calculateInterpolationAlpha\s*\([^)]*\)[^{]*\{([\s\S]*?)^\}',
-            content,
-            re.MULTILINE
-        )
-        assert method_match is not None, "calculateInterpolationAlpha method not found"
+        method_body = extract_body(time_manager_source, _CALCULATE_INTERPOLATION_ALPHA_BODY_RE)
+        assert method_body is not None, "calculateInterpolationAlpha method not found"
         
-        method_body = method_match.group(1)
         has_zero_check = '<= 0.0' in method_body or '<= 0' in method_body
         assert has_zero_check, \
             "calculateInterpolationAlpha must check for zero or negative fixedDt"
 
 
-class TestInterpolatedPositionDeclarations:
-    """Tests for InterpolatedPosition struct declarations in collision.h."""
+_INTERPOLATED_POSITION_STRUCT = 'struct InterpolatedPosition{'
+_PREVIOUS_X_MEMBER = 'float previousX;'
+_PREVIOUS_Y_MEMBER = 'float previousY;'
+_CURRENT_X_MEMBER = 'float currentX;'
+_CURRENT_Y_MEMBER = 'float currentY;'
+_SAVE_CURRENT_DECL_RE = re.compile(r'void\s+saveCurrent\s*\(\s*float\s+\w+\s*,\s*float')
+_GET_INTERPOLATED_DECL_RE = re.compile(r'void\s+getInterpolated\s*\(\s*float\s+\w+\s*,\s*float\s*&')
 
-    def test_interpolated_position_struct_declared(self):
-        """
-        Validates that collision.h declares the InterpolatedPosition struct.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        
-        has_struct = re.search(r'struct\s+InterpolatedPosition\s*\{', content)
-        assert has_struct is not None, \
-            "collision.h must declare InterpolatedPosition struct"
-
-    def test_interpolated_position_has_previous_x_member(self):
-        """
-        Confirms that InterpolatedPosition has a previousX float member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        
-        has_member = re.search(r'float\s+previousX\s*;', content)
-        assert has_member is not None, \
-            "InterpolatedPosition must have previousX float member"
-
-    def test_interpolated_position_has_previous_y_member(self):
-        """
-        Confirms that InterpolatedPosition has a previousY float member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        
-        has_member = re.search(r'float\s+previousY\s*;', content)
-        assert has_member is not None, \
-            "InterpolatedPosition must have previousY float member"
-
-    def test_interpolated_position_has_current_x_member(self):
-        """
-        Confirms that InterpolatedPosition has a currentX float member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        
-        has_member = re.search(r'float\s+currentX\s*;', content)
-        assert has_member is not None, \
-            "InterpolatedPosition must have currentX float member"
 
-    def test_interpolated_position_has_current_y_member(self):
-        """
-        Confirms that InterpolatedPosition has a currentY float member.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        
-        has_member = re.search(r'float\s+currentY\s*;', content)
-        assert has_member is not None, \
-            "InterpolatedPosition must have currentY float member"
-
-    def test_save_current_method_declared(self):
-        """
-        Validates that InterpolatedPosition declares saveCurrent method.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        
-        has_method = re.search(r'void\s+saveCurrent\s*\(\s*float\s+\w+\s*,\s*float', content)
-        assert has_method is not None, \
-            "InterpolatedPosition must declare saveCurrent(float, float) method"
+class TestInterpolatedPositionDeclarations:
+    """Tests for InterpolatedPosition struct declarations in collision.h."""
 
-    def test_get_interpolated_method_declared(self):
-        """
-        Confirms that InterpolatedPosition declares getInterpolated method
-        with alpha, outX, and outY parameters.
-        """
-        content = read_file_content('project/include/physics/collision.h')
-        
-        has_method = re.search(
-            r'void\s+getInterpolated\s*\(\s*float\s+\w+\s*,\s*float\s*&',
-            content
-        )
-        assert has_method is not None, \
-            "InterpolatedPosition must declare getInterpolated method"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_INTERPOLATED_POSITION_STRUCT,
+                     "collision.h must declare InterpolatedPosition struct",
+                     id="struct"),
+        pytest.param(_PREVIOUS_X_MEMBER,
+                     "InterpolatedPosition must have previousX float member",
+                     id="previous_x_member"),
+        pytest.param(_PREVIOUS_Y_MEMBER,
+                     "InterpolatedPosition must have previousY float member",
+                     id="previous_y_member"),
+        pytest.param(_CURRENT_X_MEMBER,
+                     "InterpolatedPosition must have currentX float member",
+                     id="current_x_member"),
+        pytest.param(_CURRENT_Y_MEMBER,
+                     "InterpolatedPosition must have currentY float member",
+                     id="current_y_member"),
+        pytest.param(_SAVE_CURRENT_DECL_RE,
+                     "InterpolatedPosition must declare saveCurrent(float, float) method",
+                     id="save_current"),
+        pytest.param(_GET_INTERPOLATED_DECL_RE,
+                     "InterpolatedPosition must declare getInterpolated method",
+                     id="get_interpolated"),
+    ])
+    def test_interpolated_position_declaration(self, collision_header, collision_header_normalized,
+                                               declaration, message):
+        """
+        Checks collision.h declares the InterpolatedPosition struct with its
+        previousX, previousY, currentX and currentY float members and the
+        saveCurrent and getInterpolated methods.
+        """
+        assert has_declaration(collision_header, collision_header_normalized, declaration), message
+
+
+_INTERPOLATED_POSITION_INIT_LIST_RE = re.compile(
+    r'InterpolatedPosition::InterpolatedPosition\s*\(\s*\)\s*:\s*([^{]+)\{'
+)
+_SAVE_CURRENT_BODY_RE = re.compile(r'void\s+InterpolatedPosition::saveCurrent\s*\([^)]+\)[^{;]*\{')
+_GET_INTERPOLATED_BODY_RE = re.compile(
+    r'void\s+InterpolatedPosition::getInterpolated\s*\([^)]+\)[^{;]*\{'
+)
 
 
 class TestInterpolatedPositionImplementations:
     """Tests for InterpolatedPosition implementations in collision.cpp."""
 
-    def test_default_constructor_initializes_to_zero(self):
+    def test_default_constructor_initializes_to_zero(self, collision_source):
         """
         Validates that InterpolatedPosition default constructor initializes
         all members to 0.0f.
         """
-        content = read_file_content('project/src/physics/collision.cpp')
-        
-        ctor_match = re.search(
-            r'InterpolatedPosition::InterpolatedPosition\s*\(\s*\)\s*:\s*([^{]+)\{',
-            content,
-            re.DOTALL
-        )
+        ctor_match = _INTERPOLATED_POSITION_INIT_LIST_RE.search(collision_source)
         assert ctor_match is not None, "Default constructor not found"
         
         init_list = ctor_match.group(1)
@@ -229,182 +282,138 @@ class TestInterpolatedPositionImplementations:
         assert has_prev_x_init, \
             "Default constructor must initialize previousX to 0.0f"
 
-    def test_save_current_updates_previous(self):
+    def test_save_current_updates_previous(self, collision_source):
         """
         Confirms that saveCurrent updates previousX/Y from currentX/Y
         before setting new current values.
         """
-        content = read_file_content('project/src/physics/collision.cpp')
-        
-        method_match = re.search(
-            r'void\s+InterpolatedPosition::saveCurrent\s*\([^)]+\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert method_match is not None, "saveCurrent method not found"
+        method_body = extract_body(collision_source, _SAVE_CURRENT_BODY_RE)
+        assert method_body is not None, "saveCurrent method not found"
         
-        method_body = method_match.group(1)
         has_prev_update = 'previousX' in method_body and 'currentX' in method_body
         assert has_prev_update, \
             "saveCurrent must update previousX from currentX"
 
-    def test_get_interpolated_performs_lerp(self):
+    def test_get_interpolated_performs_lerp(self, collision_source):
         """
         Validates that getInterpolated performs linear interpolation
         using the alpha parameter.
         """
-        content = read_file_content('project/src/physics/collision.cpp')
+        method_body = extract_body(collision_source, _GET_INTERPOLATED_BODY_RE)
+        assert method_body is not None, "getInterpolated method not found"
         
-        method_match = re.search(
-            r'void\s+InterpolatedPosition::getInterpolated\s*\([^)]+\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert method_match is not None, "getInterpolated method not found"
-        
-        method_body = method_match.group(1)
         has_lerp = 'previousX' in method_body and 'currentX' in method_body and 'alpha' in method_body
         assert has_lerp, \
             "getInterpolated must interpolate between previous and current"
 
 
+_INTERPOLATION_MEMBER = 'InterpolatedPosition interpolation;'
+
+
 class TestColliderEntryInterpolation:
     """Tests for ColliderEntry interpolation member in collision_world.h."""
 
-    def test_collider_entry_has_interpolation_member(self):
+    def test_collider_entry_has_interpolation_member(self, collision_world_header_normalized):
         """
         Validates that ColliderEntry struct has an interpolation member
         of type InterpolatedPosition.
         """
-        content = read_file_content('project/include/physics/collision_world.h')
-        
-        has_member = re.search(r'InterpolatedPosition\s+interpolation\s*;', content)
-        assert has_member is not None, \
+        has_member = _INTERPOLATION_MEMBER in collision_world_header_normalized
+        assert has_member, \
             "ColliderEntry must have interpolation member of type InterpolatedPosition"
 
 
-class TestCollisionWorldInterpolation:
-    """Tests for CollisionWorld interpolation methods."""
-
-    def test_save_positions_for_interpolation_declared(self):
-        """
-        Validates that CollisionWorld declares savePositionsForInterpolation method.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        
-        has_method = re.search(r'void\s+savePositionsForInterpolation\s*\(\s*\)', content)
-        assert has_method is not None, \
-            "CollisionWorld must declare savePositionsForInterpolation() method"
+_SAVE_POSITIONS_DECL = 'void savePositionsForInterpolation()'
+_GET_INTERPOLATED_POSITION_DECL = 'bool getInterpolatedPosition(EntityID'
+_SET_INTERPOLATION_ENABLED_DECL = 'void setInterpolationEnabled(bool'
+_IS_INTERPOLATION_ENABLED_DECL = 'bool isInterpolationEnabled()'
+_INTERPOLATION_ENABLED_MEMBER = 'bool interpolationEnabled_;'
 
-    def test_get_interpolated_position_declared(self):
-        """
-        Confirms that CollisionWorld declares getInterpolatedPosition method
-        with entityId, alpha, outX, and outY parameters.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        
-        has_method = re.search(
-            r'bool\s+getInterpolatedPosition\s*\(\s*EntityID',
-            content
-        )
-        assert has_method is not None, \
-            "CollisionWorld must declare getInterpolatedPosition method"
-
-    def test_set_interpolation_enabled_declared(self):
-        """
-        Validates that CollisionWorld declares setInterpolationEnabled method.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        
-        has_method = re.search(r'void\s+setInterpolationEnabled\s*\(\s*bool', content)
-        assert has_method is not None, \
-            "CollisionWorld must declare setInterpolationEnabled(bool) method"
 
-    def test_is_interpolation_enabled_declared(self):
-        """
-        Confirms that CollisionWorld declares isInterpolationEnabled method.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        
-        has_method = re.search(r'bool\s+isInterpolationEnabled\s*\(\s*\)', content)
-        assert has_method is not None, \
-            "CollisionWorld must declare isInterpolationEnabled() method"
+class TestCollisionWorldInterpolation:
+    """Tests for CollisionWorld interpolation methods."""
 
-    def test_interpolation_enabled_member_declared(self):
-        """
-        Validates that CollisionWorld has interpolationEnabled_ bool member.
-        """
-        content = read_file_content('project/include/physics/collision_world.h')
-        
-        has_member = re.search(r'bool\s+interpolationEnabled_\s*;', content)
-        assert has_member is not None, \
-            "CollisionWorld must have interpolationEnabled_ bool member"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_SAVE_POSITIONS_DECL,
+                     "CollisionWorld must declare savePositionsForInterpolation() method",
+                     id="save_positions_for_interpolation"),
+        pytest.param(_GET_INTERPOLATED_POSITION_DECL,
+                     "CollisionWorld must declare getInterpolatedPosition method",
+                     id="get_interpolated_position"),
+        pytest.param(_SET_INTERPOLATION_ENABLED_DECL,
+                     "CollisionWorld must declare setInterpolationEnabled(bool) method",
+                     id="set_interpolation_enabled"),
+        pytest.param(_IS_INTERPOLATION_ENABLED_DECL,
+                     "CollisionWorld must declare isInterpolationEnabled() method",
+                     id="is_interpolation_enabled"),
+        pytest.param(_INTERPOLATION_ENABLED_MEMBER,
+                     "CollisionWorld must have interpolationEnabled_ bool member",
+                     id="interpolation_enabled_member"),
+    ])
+    def test_collision_world_declaration(self, collision_world_header, collision_world_header_normalized,
+                                         declaration, message):
+        """
+        Checks collision_world.h declares the savePositionsForInterpolation,
+        getInterpolatedPosition, setInterpolationEnabled and
+        isInterpolationEnabled methods and the interpolationEnabled_ member.
+        """
+        assert has_declaration(collision_world_header, collision_world_header_normalized, declaration), message
+
+
+_INTERPOLATION_ENABLED_INIT = 'interpolationEnabled_(false)'
+_SAVE_POSITIONS_BODY_RE = re.compile(
+    r'void\s+CollisionWorld::savePositionsForInterpolation\s*\(\s*\)[^{;]*\{'
+)
+_GET_INTERPOLATED_POSITION_BODY_RE = re.compile(
+    r'bool\s+CollisionWorld::getInterpolatedPosition\s*\([^)]+\)[^{;]*\{'
+)
+_COLLIDER_ENTRY_INIT_LIST_RE = re.compile(
+    r'ColliderEntry::ColliderEntry\s*\(\s*EntityID\s+id\s*,\s*float\s+x\s*,\s*float\s+y\s*,\s*const[^)]+\)[^:]*:\s*([^{]+)\{'
+)
 
 
 class TestCollisionWorldInterpolationImplementations:
     """Tests for CollisionWorld interpolation implementations in collision_world.cpp."""
 
-    def test_constructor_initializes_interpolation_enabled(self):
+    def test_constructor_initializes_interpolation_enabled(self, collision_world_source_normalized):
         """
         Ensures CollisionWorld constructor initializes interpolationEnabled_
         to false in the initializer list.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        has_init = re.search(r'interpolationEnabled_\s*\(\s*false\s*\)', content)
-        assert has_init is not None, \
+        has_init = _INTERPOLATION_ENABLED_INIT in collision_world_source_normalized
+        assert has_init, \
             "Constructor must initialize interpolationEnabled_ to false"
 
-    def test_save_positions_iterates_colliders(self):
+    def test_save_positions_iterates_colliders(self, collision_world_source):
         """
         Validates that savePositionsForInterpolation iterates over colliders
         and calls saveCurrent on each.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
+        method_body = extract_body(collision_world_source, _SAVE_POSITIONS_BODY_RE)
+        assert method_body is not None, "savePositionsForInterpolation method not found"
         
-        method_match = re.search(
-            r'void\s+CollisionWorld::savePositionsForInterpolation\s*\(\s*\)[^{]*\{([^}]+)\}',
-            content,
-            re.DOTALL
-        )
-        assert method_match is not None, "savePositionsForInterpolation method not found"
-        
-        method_body = method_match.group(1)
         has_iteration = 'colliders_' in method_body and 'interpolation' in method_body
         assert has_iteration, \
             "savePositionsForInterpolation must iterate colliders and update interpolation"
 
-    def test_get_interpolated_position_returns_false_for_invalid_entity(self):
+    def test_get_interpolated_position_returns_false_for_invalid_entity(self, collision_world_source):
         """
         Confirms that getInterpolatedPosition returns false when entity
         is not found in the collision world.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        method_match = re.search(
-            r'bool\s+CollisionWorld::getInterpolatedPosition\s*\([^)]+\)[^{]*\{([\s\S]*?)^\}',
-            content,
-            re.MULTILINE
-        )
-        assert method_match is not None, "getInterpolatedPosition method not found"
+        method_body = extract_body(collision_world_source, _GET_INTERPOLATED_POSITION_BODY_RE)
+        assert method_body is not None, "getInterpolatedPosition method not found"
         
-        method_body = method_match.group(1)
         has_check = 'entityIndexMap_' in method_body and 'return false' in method_body
         assert has_check, \
             "getInterpolatedPosition must return false for invalid entity"
 
-    def test_collider_entry_constructors_initialize_interpolation(self):
+    def test_collider_entry_constructors_initialize_interpolation(self, collision_world_source):
         """
         Validates that ColliderEntry constructors initialize the interpolation
         member with position values.
         """
-        content = read_file_content('project/src/physics/collision_world.cpp')
-        
-        ctor_match = re.search(
-            r'ColliderEntry::ColliderEntry\s*\(\s*EntityID\s+id\s*,\s*float\s+x\s*,\s*float\s+y\s*,\s*const[^)]+\)[^:]*:\s*([^{]+)\{',
-            content,
-            re.DOTALL
-        )
+        ctor_match = _COLLIDER_ENTRY_INIT_LIST_RE.search(collision_world_source)
         assert ctor_match is not None, "ColliderEntry constructor not found"
         
         init_list = ctor_match.group(1)
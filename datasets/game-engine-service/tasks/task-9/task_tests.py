@@ -1,361 +1,388 @@
 import pytest
 import os
 import re
+from functools import lru_cache
+from pathlib import Path
+
+PROJECT_ROOT = os.environ.get("PROJECT_ROOT", "/app")
 
 COMPONENT_H = "project/include/ecs/component.h"
 COMPONENT_CPP = "project/src/ecs/component.cpp"
 TIME_MANAGER_H = "project/include/core/time_manager.h"
 TIME_MANAGER_CPP = "project/src/core/time_manager.cpp"
 
+@lru_cache(maxsize=None)
 def read_file(path):
-    """Read file content from the project directory."""
-    base = os.environ.get("PROJECT_ROOT", "/app")
-    full_path = os.path.join(base, path)
-    with open(full_path, "r") as f:
-        return f.read()
+    """Read file content from the project directory, once per test session."""
+    return Path(PROJECT_ROOT, path).read_bytes().decode()
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACING_RE = re.compile(r' ?([^\w ]) ?')
+
+
+def normalize_whitespace(source):
+    """
+    Return source with whitespace runs collapsed to a single space and
+    dropped around punctuation, so that declarations can be matched as
+    plain substrings. This is looser than a whitespace-tolerant regex:
+    spacing the regex would reject, such as 'std:: string' or '} ;', is
+    accepted too.
+    """
+    return _PUNCTUATION_SPACING_RE.sub(r'\1', _WHITESPACE_RE.sub(' ', source))
+
+
+def has_declaration(source, normalized, declaration):
+    """
+    Return whether source contains declaration, given either as a fixed
+    string looked up in the whitespace-normalized source or as a compiled
+    pattern searched in the raw source.
+    """
+    if isinstance(declaration, str):
+        return declaration in normalized
+    return declaration.search(source) is not None
+
+
+@pytest.fixture(scope="session")
+def component_header():
+    return read_file(COMPONENT_H)
+
+
+@pytest.fixture(scope="session")
+def component_source():
+    return read_file(COMPONENT_CPP)
+
+
+@pytest.fixture(scope="session")
+def time_manager_header():
+    return read_file(TIME_MANAGER_H)
+
+
+@pytest.fixture(scope="session")
+def time_manager_source():
+    return read_file(TIME_MANAGER_CPP)
+
+
+@pytest.fixture(scope="session")
+def component_header_normalized(component_header):
+    return normalize_whitespace(component_header)
+
+
+@pytest.fixture(scope="session")
+def component_source_normalized(component_source):
+    return normalize_whitespace(component_source)
+
+
+@pytest.fixture(scope="session")
+def time_manager_header_normalized(time_manager_header):
+    return normalize_whitespace(time_manager_header)
+
+
+@pytest.fixture(scope="session")
+def time_manager_source_normalized(time_manager_source):
+    return normalize_whitespace(time_manager_source)
+
+
+_MEMORY_POOL_TEMPLATE = 'template<typename T>class MemoryPool'
+_POOL_MEMBER_RE = re.compile(r'std::vector\s*<\s*T\s*\*\s*>\s+pool_')
+_FREE_LIST_MEMBER_RE = re.compile(r'std::vector\s*<\s*T\s*\*\s*>\s+freeList_')
+_ALLOCATED_COUNT_MEMBER = 'size_t allocatedCount_'
+_ALLOCATE_DECL = 'T*allocate()'
+_DEALLOCATE_DECL = 'void deallocate(T*'
+_CLEAR_DECL = 'void clear()'
+_RESERVE_DECL = 'void reserve(size_t'
+_GET_CAPACITY_DECL = 'size_t getCapacity()const'
+_GET_ALLOCATED_COUNT_DECL = 'size_t getAllocatedCount()const'
+_GET_FREE_COUNT_DECL = 'size_t getFreeCount()const'
+_CONTAINS_DECL = 'bool contains(T*'
 
 
 class TestMemoryPoolDeclarations:
     """Tests for MemoryPool template class declarations in component.h"""
 
-    def test_memorypool_template_class_declared(self):
-        """MemoryPool template class is declared with template<typename T>"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'template\s*<\s*typename\s+T\s*>\s*class\s+MemoryPool', content), \
-            "MemoryPool template class declaration not found"
-
-    def test_memorypool_has_pool_vector_member(self):
-        """MemoryPool has pool_ member as vector of T pointers"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'std::vector\s*<\s*T\s*\*\s*>\s+pool_', content), \
-            "pool_ vector member not found in MemoryPool"
-
-    def test_memorypool_has_freelist_vector_member(self):
-        """MemoryPool has freeList_ member as vector of T pointers"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'std::vector\s*<\s*T\s*\*\s*>\s+freeList_', content), \
-            "freeList_ vector member not found in MemoryPool"
-
-    def test_memorypool_has_allocatedcount_member(self):
-        """MemoryPool has allocatedCount_ member of type size_t"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+allocatedCount_', content), \
-            "allocatedCount_ member not found in MemoryPool"
-
-    def test_memorypool_allocate_method_declared(self):
-        """MemoryPool has allocate method returning T pointer"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'T\s*\*\s*allocate\s*\(\s*\)', content), \
-            "allocate() method not declared in MemoryPool"
-
-    def test_memorypool_deallocate_method_declared(self):
-        """MemoryPool has deallocate method taking T pointer"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'void\s+deallocate\s*\(\s*T\s*\*', content), \
-            "deallocate(T*) method not declared in MemoryPool"
-
-    def test_memorypool_clear_method_declared(self):
-        """MemoryPool has clear method"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'void\s+clear\s*\(\s*\)', content), \
-            "clear() method not declared in MemoryPool"
-
-    def test_memorypool_reserve_method_declared(self):
-        """MemoryPool has reserve method taking size_t"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'void\s+reserve\s*\(\s*size_t', content), \
-            "reserve(size_t) method not declared in MemoryPool"
-
-    def test_memorypool_getcapacity_method_declared(self):
-        """MemoryPool has getCapacity method returning size_t"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+getCapacity\s*\(\s*\)\s*const', content), \
-            "getCapacity() method not declared in MemoryPool"
-
-    def test_memorypool_getallocatedcount_method_declared(self):
-        """MemoryPool has getAllocatedCount method returning size_t"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+getAllocatedCount\s*\(\s*\)\s*const', content), \
-            "getAllocatedCount() method not declared in MemoryPool"
-
-    def test_memorypool_getfreecount_method_declared(self):
-        """MemoryPool has getFreeCount method returning size_t"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+getFreeCount\s*\(\s*\)\s*const', content), \
-            "getFreeCount() method not declared in MemoryPool"
-
-    def test_memorypool_contains_method_declared(self):
-        """MemoryPool has contains method returning bool"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'bool\s+contains\s*\(\s*T\s*\*', content), \
-            "contains(T*) method not declared in MemoryPool"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_MEMORY_POOL_TEMPLATE,
+                     "MemoryPool template class declaration not found",
+                     id="template_class_declared"),
+        pytest.param(_POOL_MEMBER_RE,
+                     "pool_ vector member not found in MemoryPool",
+                     id="has_pool_vector_member"),
+        pytest.param(_FREE_LIST_MEMBER_RE,
+                     "freeList_ vector member not found in MemoryPool",
+                     id="has_freelist_vector_member"),
+        pytest.param(_ALLOCATED_COUNT_MEMBER,
+                     "allocatedCount_ member not found in MemoryPool",
+                     id="has_allocatedcount_member"),
+        pytest.param(_ALLOCATE_DECL,
+                     "allocate() method not declared in MemoryPool",
+                     id="allocate_method_declared"),
+        pytest.param(_DEALLOCATE_DECL,
+                     "deallocate(T*) method not declared in MemoryPool",
+                     id="deallocate_method_declared"),
+        pytest.param(_CLEAR_DECL,
+                     "clear() method not declared in MemoryPool",
+                     id="clear_method_declared"),
+        pytest.param(_RESERVE_DECL,
+                     "reserve(size_t) method not declared in MemoryPool",
+                     id="reserve_method_declared"),
+        pytest.param(_GET_CAPACITY_DECL,
+                     "getCapacity() method not declared in MemoryPool",
+                     id="getcapacity_method_declared"),
+        pytest.param(_GET_ALLOCATED_COUNT_DECL,
+                     "getAllocatedCount() method not declared in MemoryPool",
+                     id="getallocatedcount_method_declared"),
+        pytest.param(_GET_FREE_COUNT_DECL,
+                     "getFreeCount() method not declared in MemoryPool",
+                     id="getfreecount_method_declared"),
+        pytest.param(_CONTAINS_DECL,
+                     "contains(T*) method not declared in MemoryPool",
+                     id="contains_method_declared"),
+    ])
+    def test_memory_pool_declaration(self, component_header, component_header_normalized,
+                                     declaration, message):
+        """MemoryPool template declares its members and methods"""
+        assert has_declaration(component_header, component_header_normalized, declaration), message
+
+
+_POOL_STATISTICS_CLASS = 'class PoolStatistics'
+_TOTAL_ALLOCATIONS_MEMBER = 'size_t totalAllocations_'
+_TOTAL_DEALLOCATIONS_MEMBER = 'size_t totalDeallocations_'
+_CURRENT_USAGE_MEMBER = 'size_t currentUsage_'
+_PEAK_USAGE_MEMBER = 'size_t peakUsage_'
+_RECORD_ALLOCATION_DECL = 'void recordAllocation(size_t'
+_RECORD_DEALLOCATION_DECL = 'void recordDeallocation(size_t'
+_GET_TOTAL_ALLOCATIONS_DECL = 'size_t getTotalAllocations()const'
+_GET_CURRENT_USAGE_DECL = 'size_t getCurrentUsage()const'
+_GET_PEAK_USAGE_DECL = 'size_t getPeakUsage()const'
 
 
 class TestPoolStatisticsDeclarations:
     """Tests for PoolStatistics class declarations in component.h"""
 
-    def test_poolstatistics_class_declared(self):
-        """PoolStatistics class is declared"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'class\s+PoolStatistics', content), \
-            "PoolStatistics class declaration not found"
-
-    def test_poolstatistics_has_totalallocs_member(self):
-        """PoolStatistics has totalAllocations_ member"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+totalAllocations_', content), \
-            "totalAllocations_ member not found in PoolStatistics"
-
-    def test_poolstatistics_has_totaldeallocs_member(self):
-        """PoolStatistics has totalDeallocations_ member"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+totalDeallocations_', content), \
-            "totalDeallocations_ member not found in PoolStatistics"
-
-    def test_poolstatistics_has_currentusage_member(self):
-        """PoolStatistics has currentUsage_ member"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+currentUsage_', content), \
-            "currentUsage_ member not found in PoolStatistics"
-
-    def test_poolstatistics_has_peakusage_member(self):
-        """PoolStatistics has peakUsage_ member"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+peakUsage_', content), \
-            "peakUsage_ member not found in PoolStatistics"
-
-    def test_poolstatistics_recordallocation_declared(self):
-        """PoolStatistics has recordAllocation method"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'void\s+recordAllocation\s*\(\s*size_t', content), \
-            "recordAllocation() method not declared"
-
-    def test_poolstatistics_recorddeallocation_declared(self):
-        """PoolStatistics has recordDeallocation method"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'void\s+recordDeallocation\s*\(\s*size_t', content), \
-            "recordDeallocation() method not declared"
-
-    def test_poolstatistics_gettotalallocations_declared(self):
-        """PoolStatistics has getTotalAllocations method"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+getTotalAllocations\s*\(\s*\)\s*const', content), \
-            "getTotalAllocations() method not declared"
-
-    def test_poolstatistics_getcurrentusage_declared(self):
-        """PoolStatistics has getCurrentUsage method"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+getCurrentUsage\s*\(\s*\)\s*const', content), \
-            "getCurrentUsage() method not declared"
-
-    def test_poolstatistics_getpeakusage_declared(self):
-        """PoolStatistics has getPeakUsage method"""
-        content = read_file(COMPONENT_H)
-        assert re.search(r'size_t\s+getPeakUsage\s*\(\s*\)\s*const', content), \
-            "getPeakUsage() method not declared"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_POOL_STATISTICS_CLASS,
+                     "PoolStatistics class declaration not found",
+                     id="class_declared"),
+        pytest.param(_TOTAL_ALLOCATIONS_MEMBER,
+                     "totalAllocations_ member not found in PoolStatistics",
+                     id="has_totalallocs_member"),
+        pytest.param(_TOTAL_DEALLOCATIONS_MEMBER,
+                     "totalDeallocations_ member not found in PoolStatistics",
+                     id="has_totaldeallocs_member"),
+        pytest.param(_CURRENT_USAGE_MEMBER,
+                     "currentUsage_ member not found in PoolStatistics",
+                     id="has_currentusage_member"),
+        pytest.param(_PEAK_USAGE_MEMBER,
+                     "peakUsage_ member not found in PoolStatistics",
+                     id="has_peakusage_member"),
+        pytest.param(_RECORD_ALLOCATION_DECL,
+                     "recordAllocation() method not declared",
+                     id="recordallocation_declared"),
+        pytest.param(_RECORD_DEALLOCATION_DECL,
+                     "recordDeallocation() method not declared",
+                     id="recorddeallocation_declared"),
+        pytest.param(_GET_TOTAL_ALLOCATIONS_DECL,
+                     "getTotalAllocations() method not declared",
+                     id="gettotalallocations_declared"),
+        pytest.param(_GET_CURRENT_USAGE_DECL,
+                     "getCurrentUsage() method not declared",
+                     id="getcurrentusage_declared"),
+        pytest.param(_GET_PEAK_USAGE_DECL,
+                     "getPeakUsage() method not declared",
+                     id="getpeakusage_declared"),
+    ])
+    def test_pool_statistics_declaration(self, component_header, component_header_normalized,
+                                         declaration, message):
+        """PoolStatistics class declares its counters and methods"""
+        assert has_declaration(component_header, component_header_normalized, declaration), message
+
+
+_FREE_LIST_EMPTY_CALL = 'freeList_.empty()'
+_NEW_T = 'new T()'
+_POOL_PUSH_BACK = 'pool_.push_back'
+_FREE_LIST_POP_BACK = 'freeList_.pop_back()'
+_FREE_LIST_PUSH_BACK = 'freeList_.push_back'
+_DELETE_PTR = 'delete ptr'
+_TRANSFORM_POOL_INSTANTIATION = 'template class MemoryPool<TransformComponent>'
+_TAG_POOL_INSTANTIATION = 'template class MemoryPool<TagComponent>'
 
 
 class TestMemoryPoolImplementations:
     """Tests for MemoryPool implementations in component.cpp"""
 
-    def test_memorypool_allocate_checks_freelist_empty(self):
-        """allocate() checks if freeList is empty"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'freeList_\.empty\s*\(\s*\)', content), \
-            "allocate() should check freeList_.empty()"
-
-    def test_memorypool_allocate_uses_new(self):
-        """allocate() creates new objects with new T()"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'new\s+T\s*\(\s*\)', content), \
-            "allocate() should use new T()"
-
-    def test_memorypool_allocate_pushes_to_pool(self):
-        """allocate() pushes new objects to pool_"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'pool_\.push_back', content), \
-            "allocate() should push to pool_"
-
-    def test_memorypool_allocate_pops_from_freelist(self):
-        """allocate() pops from freeList when available"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'freeList_\.pop_back\s*\(\s*\)', content), \
-            "allocate() should pop from freeList_"
-
-    def test_memorypool_deallocate_pushes_to_freelist(self):
-        """deallocate() pushes pointer back to freeList"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'freeList_\.push_back', content), \
-            "deallocate() should push to freeList_"
-
-    def test_memorypool_clear_deletes_objects(self):
-        """clear() deletes all objects in pool"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'delete\s+ptr', content), \
-            "clear() should delete objects"
-
-    def test_memorypool_template_instantiated_for_transform(self):
-        """MemoryPool is explicitly instantiated for TransformComponent"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'template\s+class\s+MemoryPool\s*<\s*TransformComponent\s*>', content), \
-            "MemoryPool should be instantiated for TransformComponent"
-
-    def test_memorypool_template_instantiated_for_tag(self):
-        """MemoryPool is explicitly instantiated for TagComponent"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'template\s+class\s+MemoryPool\s*<\s*TagComponent\s*>', content), \
-            "MemoryPool should be instantiated for TagComponent"
+    @pytest.mark.parametrize("statement,message", [
+        pytest.param(_FREE_LIST_EMPTY_CALL,
+                     "allocate() should check freeList_.empty()",
+                     id="allocate_checks_freelist_empty"),
+        pytest.param(_NEW_T,
+                     "allocate() should use new T()",
+                     id="allocate_uses_new"),
+        pytest.param(_POOL_PUSH_BACK,
+                     "allocate() should push to pool_",
+                     id="allocate_pushes_to_pool"),
+        pytest.param(_FREE_LIST_POP_BACK,
+                     "allocate() should pop from freeList_",
+                     id="allocate_pops_from_freelist"),
+        pytest.param(_FREE_LIST_PUSH_BACK,
+                     "deallocate() should push to freeList_",
+                     id="deallocate_pushes_to_freelist"),
+        pytest.param(_DELETE_PTR,
+                     "clear() should delete objects",
+                     id="clear_deletes_objects"),
+        pytest.param(_TRANSFORM_POOL_INSTANTIATION,
+                     "MemoryPool should be instantiated for TransformComponent",
+                     id="template_instantiated_for_transform"),
+        pytest.param(_TAG_POOL_INSTANTIATION,
+                     "MemoryPool should be instantiated for TagComponent",
+                     id="template_instantiated_for_tag"),
+    ])
+    def test_memory_pool_implementation(self, component_source, component_source_normalized,
+                                        statement, message):
+        """MemoryPool methods manage pool_ and freeList_ and are instantiated"""
+        assert has_declaration(component_source, component_source_normalized, statement), message
+
+
+_TOTAL_ALLOCATIONS_INCREMENT_RE = re.compile(r'totalAllocations_\s*\+\+')
+_CURRENT_USAGE_ADD = 'currentUsage_+='
+_PEAK_USAGE_UPDATE = 'peakUsage_=currentUsage_'
+_TOTAL_DEALLOCATIONS_INCREMENT_RE = re.compile(r'totalDeallocations_\s*\+\+')
+_TOTAL_ALLOCATIONS_RESET = 'totalAllocations_=0'
 
 
 class TestPoolStatisticsImplementations:
     """Tests for PoolStatistics implementations in component.cpp"""
 
-    def test_poolstatistics_recordallocation_increments_counter(self):
-        """recordAllocation increments totalAllocations_"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'totalAllocations_\s*\+\+', content), \
-            "recordAllocation should increment totalAllocations_"
-
-    def test_poolstatistics_recordallocation_adds_to_currentusage(self):
-        """recordAllocation adds bytes to currentUsage_"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'currentUsage_\s*\+=', content), \
-            "recordAllocation should add to currentUsage_"
-
-    def test_poolstatistics_recordallocation_updates_peak(self):
-        """recordAllocation updates peakUsage_ when current exceeds peak"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'peakUsage_\s*=\s*currentUsage_', content), \
-            "recordAllocation should update peakUsage_"
-
-    def test_poolstatistics_recorddeallocation_increments_counter(self):
-        """recordDeallocation increments totalDeallocations_"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'totalDeallocations_\s*\+\+', content), \
-            "recordDeallocation should increment totalDeallocations_"
-
-    def test_poolstatistics_reset_zeros_allocations(self):
-        """reset() sets totalAllocations_ to 0"""
-        content = read_file(COMPONENT_CPP)
-        assert re.search(r'totalAllocations_\s*=\s*0', content), \
-            "reset() should zero totalAllocations_"
+    @pytest.mark.parametrize("statement,message", [
+        pytest.param(_TOTAL_ALLOCATIONS_INCREMENT_RE,
+                     "recordAllocation should increment totalAllocations_",
+                     id="recordallocation_increments_counter"),
+        pytest.param(_CURRENT_USAGE_ADD,
+                     "recordAllocation should add to currentUsage_",
+                     id="recordallocation_adds_to_currentusage"),
+        pytest.param(_PEAK_USAGE_UPDATE,
+                     "recordAllocation should update peakUsage_",
+                     id="recordallocation_updates_peak"),
+        pytest.param(_TOTAL_DEALLOCATIONS_INCREMENT_RE,
+                     "recordDeallocation should increment totalDeallocations_",
+                     id="recorddeallocation_increments_counter"),
+        pytest.param(_TOTAL_ALLOCATIONS_RESET,
+                     "reset() should zero totalAllocations_",
+                     id="reset_zeros_allocations"),
+    ])
+    def test_pool_statistics_implementation(self, component_source, component_source_normalized,
+                                            statement, message):
+        """PoolStatistics methods update the usage counters"""
+        assert has_declaration(component_source, component_source_normalized, statement), message
+
+
+_FRAME_ALLOCATIONS_MEMBER = 'size_t frameAllocations_'
+_FRAME_DEALLOCATIONS_MEMBER = 'size_t frameDeallocations_'
+_RECORD_POOL_ALLOCATION_DECL = 'void recordPoolAllocation(size_t'
+_RECORD_POOL_DEALLOCATION_DECL = 'void recordPoolDeallocation(size_t'
+_GET_FRAME_ALLOCATIONS_DECL = 'size_t getFrameAllocations()const'
+_GET_FRAME_DEALLOCATIONS_DECL = 'size_t getFrameDeallocations()const'
+_RESET_FRAME_STATS_DECL = 'void resetFrameStats()'
 
 
 class TestTimeManagerPoolTracking:
     """Tests for frame allocation tracking in TimeManager"""
 
-    def test_timemanager_has_frameallocations_member(self):
-        """TimeManager has frameAllocations_ member"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'size_t\s+frameAllocations_', content), \
-            "frameAllocations_ member not found in TimeManager"
-
-    def test_timemanager_has_framedeallocations_member(self):
-        """TimeManager has frameDeallocations_ member"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'size_t\s+frameDeallocations_', content), \
-            "frameDeallocations_ member not found in TimeManager"
-
-    def test_timemanager_recordpoolallocation_declared(self):
-        """TimeManager has recordPoolAllocation method"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'void\s+recordPoolAllocation\s*\(\s*size_t', content), \
-            "recordPoolAllocation() method not declared"
-
-    def test_timemanager_recordpooldeallocation_declared(self):
-        """TimeManager has recordPoolDeallocation method"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'void\s+recordPoolDeallocation\s*\(\s*size_t', content), \
-            "recordPoolDeallocation() method not declared"
-
-    def test_timemanager_getframeallocations_declared(self):
-        """TimeManager has getFrameAllocations method"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'size_t\s+getFrameAllocations\s*\(\s*\)\s*const', content), \
-            "getFrameAllocations() method not declared"
-
-    def test_timemanager_getframedeallocations_declared(self):
-        """TimeManager has getFrameDeallocations method"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'size_t\s+getFrameDeallocations\s*\(\s*\)\s*const', content), \
-            "getFrameDeallocations() method not declared"
-
-    def test_timemanager_resetframestats_declared(self):
-        """TimeManager has resetFrameStats method"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'void\s+resetFrameStats\s*\(\s*\)', content), \
-            "resetFrameStats() method not declared"
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_FRAME_ALLOCATIONS_MEMBER,
+                     "frameAllocations_ member not found in TimeManager",
+                     id="has_frameallocations_member"),
+        pytest.param(_FRAME_DEALLOCATIONS_MEMBER,
+                     "frameDeallocations_ member not found in TimeManager",
+                     id="has_framedeallocations_member"),
+        pytest.param(_RECORD_POOL_ALLOCATION_DECL,
+                     "recordPoolAllocation() method not declared",
+                     id="recordpoolallocation_declared"),
+        pytest.param(_RECORD_POOL_DEALLOCATION_DECL,
+                     "recordPoolDeallocation() method not declared",
+                     id="recordpooldeallocation_declared"),
+        pytest.param(_GET_FRAME_ALLOCATIONS_DECL,
+                     "getFrameAllocations() method not declared",
+                     id="getframeallocations_declared"),
+        pytest.param(_GET_FRAME_DEALLOCATIONS_DECL,
+                     "getFrameDeallocations() method not declared",
+                     id="getframedeallocations_declared"),
+        pytest.param(_RESET_FRAME_STATS_DECL,
+                     "resetFrameStats() method not declared",
+                     id="resetframestats_declared"),
+    ])
+    def test_time_manager_declaration(self, time_manager_header, time_manager_header_normalized,
+                                      declaration, message):
+        """TimeManager declares frame allocation members and methods"""
+        assert has_declaration(time_manager_header, time_manager_header_normalized, declaration), message
+
+
+_FRAME_ALLOCATIONS_INIT = 'frameAllocations_(0)'
+_FRAME_DEALLOCATIONS_INIT = 'frameDeallocations_(0)'
+_FRAME_ALLOCATIONS_RESET = 'frameAllocations_=0'
+_FRAME_DEALLOCATIONS_RESET = 'frameDeallocations_=0'
+_FRAME_ALLOCATIONS_ADD = 'frameAllocations_+='
+_FRAME_DEALLOCATIONS_ADD = 'frameDeallocations_+='
 
 
 class TestTimeManagerPoolImplementations:
     """Tests for pool tracking implementations in time_manager.cpp"""
 
-    def test_timemanager_constructor_inits_frameallocations(self):
-        """TimeManager constructor initializes frameAllocations_ to 0"""
-        content = read_file(TIME_MANAGER_CPP)
-        assert re.search(r'frameAllocations_\s*\(\s*0\s*\)', content), \
-            "Constructor should initialize frameAllocations_ to 0"
-
-    def test_timemanager_constructor_inits_framedeallocations(self):
-        """TimeManager constructor initializes frameDeallocations_ to 0"""
-        content = read_file(TIME_MANAGER_CPP)
-        assert re.search(r'frameDeallocations_\s*\(\s*0\s*\)', content), \
-            "Constructor should initialize frameDeallocations_ to 0"
-
-    def test_timemanager_reset_zeros_frameallocations(self):
-        """reset() sets frameAllocations_ to 0"""
-        content = read_file(TIME_MANAGER_CPP)
-        assert re.search(r'frameAllocations_\s*=\s*0', content), \
-            "reset() should zero frameAllocations_"
-
-    def test_timemanager_reset_zeros_framedeallocations(self):
-        """reset() sets frameDeallocations_ to 0"""
-        content = read_file(TIME_MANAGER_CPP)
-        assert re.search(r'frameDeallocations_\s*=\s*0', content), \
-            "reset() should zero frameDeallocations_"
-
-    def test_timemanager_recordpoolallocation_adds_bytes(self):
-        """recordPoolAllocation adds bytes to frameAllocations_"""
-        content = read_file(TIME_MANAGER_CPP)
-        assert re.search(r'frameAllocations_\s*\+=', content), \
-            "recordPoolAllocation should add to frameAllocations_"
-
-    def test_timemanager_recordpooldeallocation_adds_bytes(self):
-        """recordPoolDeallocation adds bytes to frameDeallocations_"""
-        content = read_file(TIME_MANAGER_CPP)
-        assert re.search(r'frameDeallocations_\s*\+=', content), \
-            "recordPoolDeallocation should add to frameDeallocations_"
+    @pytest.mark.parametrize("statement,message", [
+        pytest.param(_FRAME_ALLOCATIONS_INIT,
+                     "Constructor should initialize frameAllocations_ to 0",
+                     id="constructor_inits_frameallocations"),
+        pytest.param(_FRAME_DEALLOCATIONS_INIT,
+                     "Constructor should initialize frameDeallocations_ to 0",
+                     id="constructor_inits_framedeallocations"),
+        pytest.param(_FRAME_ALLOCATIONS_RESET,
+                     "reset() should zero frameAllocations_",
+                     id="reset_zeros_frameallocations"),
+        pytest.param(_FRAME_DEALLOCATIONS_RESET,
+                     "reset() should zero frameDeallocations_",
+                     id="reset_zeros_framedeallocations"),
+        pytest.param(_FRAME_ALLOCATIONS_ADD,
+                     "recordPoolAllocation should add to frameAllocations_",
+                     id="recordpoolallocation_adds_bytes"),
+        pytest.param(_FRAME_DEALLOCATIONS_ADD,
+                     "recordPoolDeallocation should add to frameDeallocations_",
+                     id="recordpooldeallocation_adds_bytes"),
+    ])
+    def test_time_manager_implementation(self, time_manager_source, time_manager_source_normalized,
+                                         statement, message):
+        """TimeManager initializes, resets and updates frame allocation counters"""
+        assert has_declaration(time_manager_source, time_manager_source_normalized, statement), message
+
+
+_POOL_MEMORY_STATS_STRUCT = 'struct PoolMemoryStats'
+_POOL_COUNT_MEMBER = 'size_t poolCount'
+_TOTAL_CAPACITY_MEMBER = 'size_t totalCapacity'
+_TOTAL_ALLOCATED_MEMBER = 'size_t totalAllocated'
+_POOL_MEMORY_STATS_CONSTRUCTOR = 'PoolMemoryStats::PoolMemoryStats()'
 
 
 class TestPoolMemoryStatsStruct:
     """Tests for PoolMemoryStats struct"""
 
-    def test_poolmemorystats_struct_declared(self):
-        """PoolMemoryStats struct is declared in time_manager.h"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'struct\s+PoolMemoryStats', content), \
-            "PoolMemoryStats struct not declared"
-
-    def test_poolmemorystats_has_poolcount(self):
-        """PoolMemoryStats has poolCount member"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'size_t\s+poolCount', content), \
-            "poolCount member not found in PoolMemoryStats"
-
-    def test_poolmemorystats_has_totalcapacity(self):
-        """PoolMemoryStats has totalCapacity member"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'size_t\s+totalCapacity', content), \
-            "totalCapacity member not found in PoolMemoryStats"
-
-    def test_poolmemorystats_has_totalallocated(self):
-        """PoolMemoryStats has totalAllocated member"""
-        content = read_file(TIME_MANAGER_H)
-        assert re.search(r'size_t\s+totalAllocated', content), \
-            "totalAllocated member not found in PoolMemoryStats"
-
-    def test_poolmemorystats_constructor_implemented(self):
+    @pytest.mark.parametrize("declaration,message", [
+        pytest.param(_POOL_MEMORY_STATS_STRUCT,
+                     "PoolMemoryStats struct not declared",
+                     id="struct_declared"),
+        pytest.param(_POOL_COUNT_MEMBER,
+                     "poolCount member not found in PoolMemoryStats",
+                     id="has_poolcount"),
+        pytest.param(_TOTAL_CAPACITY_MEMBER,
+                     "totalCapacity member not found in PoolMemoryStats",
+                     id="has_totalcapacity"),
+        pytest.param(_TOTAL_ALLOCATED_MEMBER,
+                     "totalAllocated member not found in PoolMemoryStats",
+                     id="has_totalallocated"),
+    ])
+    def test_pool_memory_stats_declaration(self, time_manager_header, time_manager_header_normalized,
+                                           declaration, message):
+        """PoolMemoryStats struct is declared with its members"""
+        assert has_declaration(time_manager_header, time_manager_header_normalized, declaration), message
+
+    def test_poolmemorystats_constructor_implemented(self, time_manager_source_normalized):
         """PoolMemoryStats constructor is implemented"""
-        content = read_file(TIME_MANAGER_CPP)
-        assert re.search(r'PoolMemoryStats::PoolMemoryStats\s*\(\s*\)', content), \
+        assert _POOL_MEMORY_STATS_CONSTRUCTOR in time_manager_source_normalized, \
             "PoolMemoryStats constructor not implemented"